@@ -0,0 +1,97 @@
+"""
+ANSI color codes, line output and pacing shared by the CsharpFlow demo scripts
+
+Defined as plain module-level constants so the demos can use them
+directly as globals.
+"""
+
+import io
+import math
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+HEADER = '\033[95m'
+OKBLUE = '\033[94m'
+OKCYAN = '\033[96m'
+OKGREEN = '\033[92m'
+WARNING = '\033[93m'
+FAIL = '\033[91m'
+ENDC = '\033[0m'
+BOLD = '\033[1m'
+UNDERLINE = '\033[4m'
+
+# Precomposed prefixes for the per-line print helpers
+STEP_OPEN = f'{OKCYAN}['
+STEP_CLOSE = f']{ENDC} '
+SUCCESS_MARK = f'{OKGREEN}✓{ENDC} '
+WARN_MARK = f'{WARNING}⚠{ENDC} '
+ERROR_MARK = f'{FAIL}✗{ENDC} '
+
+# The same prefixes pre-encoded for emit()
+STEP_OPEN_B = STEP_OPEN.encode()
+SUCCESS_MARK_B = SUCCESS_MARK.encode()
+WARN_MARK_B = WARN_MARK.encode()
+ERROR_MARK_B = ERROR_MARK.encode()
+
+# The prebuilt prefixes (and the demo text, which has emoji) are UTF-8, so
+# writing straight to fd 1 is only safe on a UTF-8 terminal; anything else
+# falls back to print(), which encodes for the stream
+_ENCODING = (getattr(sys.stdout, 'encoding', None) or '').lower()
+_RAW_STDOUT = sys.stdout.isatty() and _ENCODING in ('utf-8', 'utf8')
+
+def emit(prefix: bytes, text: str):
+    """Write prefix + text + newline as one line of demo output"""
+    # sys.stdout may be redirected (e.g. batched demo sections)
+    if _RAW_STDOUT and sys.stdout is sys.__stdout__:
+        os.write(1, prefix + text.encode() + b'\n')
+    else:
+        print(prefix.decode(), text, sep='')
+
+def _demo_speed() -> float:
+    """Playback speed from DEMO_SPEED; anything but a positive number means 1"""
+    raw = os.environ.get("DEMO_SPEED", "1")
+    try:
+        speed = float(raw)
+    except ValueError:
+        speed = 0.0
+    if not (speed > 0 and math.isfinite(speed)):
+        print(f"{WARN_MARK}DEMO_SPEED={raw!r} is not a positive number, using 1", file=sys.stderr)
+        return 1.0
+    return speed
+
+# Playback speed multiplier, e.g. DEMO_SPEED=1000 for CI smoke tests
+DEMO_SPEED = _demo_speed()
+
+def demo_sleep(seconds: float):
+    """Sleep for a demo-time interval, scaled by DEMO_SPEED"""
+    if DEMO_SPEED != 1.0:
+        seconds /= DEMO_SPEED
+    if seconds >= 0.001:
+        time.sleep(seconds)
+
+@contextmanager
+def batched_out(enabled: bool = True):
+    """Collect everything printed in the block and write it out at once"""
+    if not enabled:
+        yield
+        return
+        
+    buf = io.StringIO()
+    old = sys.stdout
+    sys.stdout = buf
+    try:
+        yield
+    finally:
+        sys.stdout = old
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+
+__all__ = [
+    'HEADER', 'OKBLUE', 'OKCYAN', 'OKGREEN', 'WARNING', 'FAIL', 'ENDC',
+    'BOLD', 'UNDERLINE',
+    'STEP_OPEN', 'STEP_CLOSE', 'SUCCESS_MARK', 'WARN_MARK', 'ERROR_MARK',
+    'STEP_OPEN_B', 'SUCCESS_MARK_B', 'WARN_MARK_B', 'ERROR_MARK_B',
+    'emit', 'DEMO_SPEED', 'demo_sleep', 'batched_out',
+]
@@ -5,12 +5,14 @@ Provides easy building with CMake or direct tools
 """
 
 import os
+import re
 import sys
+import time
 import shutil
-import argparse
 import subprocess
+from types import SimpleNamespace
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple, Dict, Iterator, Callable
 
 class Colors:
     """ANSI color codes for terminal output"""
@@ -20,70 +22,361 @@ class Colors:
     BLUE = '\033[0;34m'
     NC = '\033[0m'  # No Color
 
+CMAKE_VERSION_RE = re.compile(r"cmake version (\d+)\.(\d+)\.(\d+)")
+
+# Directories never scanned when fingerprinting sources
+FINGERPRINT_SKIP_DIRS = {".git", "Bin", "bin", "obj", "build", "packages"}
+
+# Everything MSBuild reads for a build: sources, projects, the solution,
+# imported .props/.targets, packages.config/App.config/NuGet.Config and
+# embedded resources (matched case-insensitively)
+FINGERPRINT_SUFFIXES = (
+    ".cs", ".csproj", ".sln", ".props", ".targets", ".config",
+    ".resx", ".settings", ".ruleset", ".snk", ".editorconfig"
+)
+
+# The assemblies a direct build produces; all must exist to skip a build
+BUILD_OUTPUTS = ("Flow.dll", "TestFlow.dll")
+
+def job_count() -> int:
+    """Number of CPUs this process may run on"""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
 class BuildScript:
     def __init__(self):
         self.script_dir = Path(__file__).parent.absolute()
         self.bin_dir = self.script_dir / "Bin"
+        self._cmake_version: Optional[Tuple[int, int, int]] = None
+        self._tool_cache: Dict[str, Optional[str]] = {}
+        # Tool paths found by earlier runs, loaded on the first check_tool
+        self._known_tools: Optional[Dict[str, str]] = None
+        
+        # Message prefixes are built once; no ANSI codes when output is
+        # redirected to a file or CI log
+        if sys.stdout.isatty():
+            green, yellow, red, nc = Colors.GREEN, Colors.YELLOW, Colors.RED, Colors.NC
+        else:
+            green = yellow = red = nc = ""
+        self._info_prefix = f"{green}[INFO]{nc} "
+        self._warn_prefix = f"{yellow}[WARN]{nc} "
+        self._error_prefix = f"{red}[ERROR]{nc} "
+        
+    def _write(self, prefix: str, message: str):
+        # One write per line so lines from other threads cannot interleave
+        sys.stdout.write(prefix + message + "\n")
         
     def print_status(self, message: str):
         """Print status message in green"""
-        print(f"{Colors.GREEN}[INFO]{Colors.NC} {message}")
+        self._write(self._info_prefix, message)
         
     def print_warning(self, message: str):
         """Print warning message in yellow"""
-        print(f"{Colors.YELLOW}[WARN]{Colors.NC} {message}")
+        self._write(self._warn_prefix, message)
         
     def print_error(self, message: str):
         """Print error message in red"""
-        print(f"{Colors.RED}[ERROR]{Colors.NC} {message}")
+        self._write(self._error_prefix, message)
         
+    def _load_known_tools(self) -> Dict[str, str]:
+        """Load tool paths persisted by previous runs with the same PATH and kernel"""
+        import json
+        import hashlib
+        
+        # os.uname avoids importing platform where it is available
+        if hasattr(os, "uname"):
+            release = os.uname().release
+        else:
+            import platform
+            release = platform.release()
+        cache_key = hashlib.blake2b(
+            (os.environ.get("PATH", "") + "|" + release).encode(),
+            digest_size=8
+        ).hexdigest()
+        cache_home = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+        self._tool_cache_file = cache_home / "csharpflow" / f"tools-{cache_key}.json"
+        
+        try:
+            known = json.loads(self._tool_cache_file.read_text())
+        except (OSError, ValueError):
+            return {}
+        return known if isinstance(known, dict) else {}
+        
+    def _save_known_tools(self):
+        """Atomically persist the tool paths found so far"""
+        import json
+        import tempfile
+        
+        try:
+            self._tool_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self._tool_cache_file.parent, delete=False
+            ) as f:
+                json.dump(self._known_tools, f)
+            os.replace(f.name, self._tool_cache_file)
+        except OSError:
+            pass
+            
     def check_tool(self, tool_name: str) -> Optional[str]:
         """Check if a tool is available and return its path"""
-        tool_path = shutil.which(tool_name)
+        if tool_name in self._tool_cache:
+            return self._tool_cache[tool_name]
+            
+        if self._known_tools is None:
+            self._known_tools = self._load_known_tools()
+        tool_path = self._known_tools.get(tool_name)
+        if not (tool_path and os.path.isfile(tool_path) and os.access(tool_path, os.X_OK)):
+            tool_path = shutil.which(tool_name)
+            if tool_path:
+                self._known_tools[tool_name] = tool_path
+                self._save_known_tools()
+                
+        self._tool_cache[tool_name] = tool_path
         if tool_path:
             self.print_status(f"Found {tool_name}: {tool_path}")
-            return tool_path
-        return None
+        return tool_path
+        
+    def _not_found_message(self, command: List[str], error: FileNotFoundError) -> str:
+        """Tell a missing executable apart from a missing working directory"""
+        if error.filename and error.filename != command[0]:
+            return f"Directory not found: {error.filename}"
+        return f"Command not found: {command[0]}"
+        
+    def _spawn_options(self, cwd: Optional[Path] = None) -> dict:
+        """Keyword arguments shared by every build subprocess
+        
+        Children never read from the terminal, and cwd is only passed when
+        it differs from the current directory.
+        """
+        cwd = cwd or self.script_dir
+        try:
+            same_dir = os.path.samefile(cwd, os.getcwd())
+        except OSError:
+            # A missing directory is reported by Popen itself, not here
+            same_dir = False
+        return {
+            "stdin": subprocess.DEVNULL,
+            "cwd": None if same_dir else cwd,
+        }
+        
+    def _piped(self, command: List[str], cwd: Optional[Path]) -> subprocess.Popen:
+        """Start a command with its combined output piped back to this process"""
+        return subprocess.Popen(
+            command,
+            **self._spawn_options(cwd),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
+            text=True,
+            errors="replace"
+        )
         
+    def _relay_output(self, process: subprocess.Popen, seen_warnings: set, lock) -> None:
+        """Copy a child's output to stdout line by line, showing each warning once"""
+        import hashlib
+        
+        for line in process.stdout:
+            with lock:
+                if "warning" in line:
+                    digest = hashlib.blake2b(line.encode(), digest_size=8).digest()
+                    if digest in seen_warnings:
+                        continue
+                    seen_warnings.add(digest)
+                sys.stdout.write(line)
+                
     def run_command(self, command: List[str], cwd: Optional[Path] = None) -> bool:
         """Run a command and return success status"""
+        import threading
+        
         try:
             cmd_str = ' '.join(command)
             self.print_status(f"Running: {cmd_str}")
             
-            result = subprocess.run(
-                command,
-                cwd=cwd or self.script_dir,
-                check=True,
-                capture_output=False
-            )
+            # Pipe output through Python rather than handing the child the
+            # terminal, so repeated compiler/analyzer warnings (reported
+            # once per project and target) are only shown once
+            process = self._piped(command, cwd)
+            self._relay_output(process, set(), threading.Lock())
+                
+            returncode = process.wait()
+            if returncode != 0:
+                self.print_error(f"Command failed with exit code {returncode}")
+                return False
             return True
             
-        except subprocess.CalledProcessError as e:
-            self.print_error(f"Command failed with exit code {e.returncode}")
+        except FileNotFoundError as e:
+            self.print_error(self._not_found_message(command, e))
             return False
-        except FileNotFoundError:
-            self.print_error(f"Command not found: {command[0]}")
+            
+    def run_commands_parallel(self, commands: List[List[str]], cwd: Optional[Path] = None) -> bool:
+        """Run several independent commands concurrently and return overall success"""
+        import threading
+        
+        processes = []
+        try:
+            for command in commands:
+                self.print_status(f"Running: {' '.join(command)}")
+                processes.append(self._piped(command, cwd))
+        except FileNotFoundError as e:
+            self.print_error(self._not_found_message(command, e))
+            for process in processes:
+                process.communicate()
+            return False
+            
+        # One reader per child, sharing the warning filter with run_command
+        # so a warning both projects report is shown once and lines from
+        # different children never interleave mid-line
+        seen_warnings = set()
+        lock = threading.Lock()
+        readers = [
+            threading.Thread(target=self._relay_output, args=(process, seen_warnings, lock))
+            for process in processes
+        ]
+        for reader in readers:
+            reader.start()
+        for reader in readers:
+            reader.join()
+            
+        success = True
+        for process in processes:
+            returncode = process.wait()
+            if returncode != 0:
+                self.print_error(f"Command failed with exit code {returncode}")
+                success = False
+        return success
+        
+    def tests_reference_flow(self) -> bool:
+        """Whether TestFlow.csproj pulls in Flow.csproj as a project reference"""
+        try:
+            project = (self.script_dir / "TestFlow" / "TestFlow.csproj").read_text(encoding="utf-8-sig")
+        except OSError:
             return False
+        return re.search(r'<ProjectReference\s+Include="[^"]*Flow\.csproj"', project) is not None
+        
+    def cmake_version(self) -> Tuple[int, int, int]:
+        """Return the installed CMake version, probing it only once"""
+        if self._cmake_version is None:
+            self._cmake_version = (0, 0, 0)
+            try:
+                result = subprocess.run(
+                    ["cmake", "--version"],
+                    **self._spawn_options(),
+                    capture_output=True,
+                    text=True
+                )
+                match = CMAKE_VERSION_RE.match(result.stdout)
+                if match:
+                    self._cmake_version = tuple(int(part) for part in match.groups())
+            except FileNotFoundError:
+                pass
+        return self._cmake_version
+        
+    def create_directories(self, build_type: str):
+        """Create the output directory for the build type being built"""
+        output_dir = self.bin_dir / build_type
+        if output_dir.exists():
+            return
             
-    def create_directories(self):
-        """Create necessary build directories"""
         self.print_status("Creating build directories...")
-        (self.bin_dir / "Debug").mkdir(parents=True, exist_ok=True)
-        (self.bin_dir / "Release").mkdir(parents=True, exist_ok=True)
+        try:
+            output_dir.mkdir(parents=True)
+        except FileExistsError:
+            pass
+        
+    def cmake_config(self, build_type: str, unity_support: bool) -> dict:
+        """Describe the CMake configuration a build would use"""
+        return {
+            "generator": "Ninja" if self.check_tool("ninja") else "default",
+            "build_type": build_type,
+            "unity": unity_support,
+        }
+        
+    def last_cmake_config(self, build_type: str) -> Optional[dict]:
+        """Load the configuration recorded by the previous configure, if any"""
+        import json
+        
+        config_file = self.script_dir / f"build-{build_type}" / ".last_config.json"
+        try:
+            return json.loads(config_file.read_text())
+        except (OSError, ValueError):
+            return None
+            
+    def save_cmake_config(self, config: dict):
+        """Record the configuration used by a successful configure"""
+        import json
         
-    def clean_build(self):
-        """Clean previous build artifacts"""
+        config_file = self.script_dir / f"build-{config['build_type']}" / ".last_config.json"
+        config_file.write_text(json.dumps(config))
+        
+    def _parallel_rmtree(self, path: Path):
+        """Remove a directory tree, deleting its top-level entries concurrently"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        def remove(child: Path):
+            try:
+                if child.is_dir() and not child.is_symlink():
+                    shutil.rmtree(child)
+                else:
+                    child.unlink()
+            except FileNotFoundError:
+                pass
+                
+        try:
+            children = list(path.iterdir())
+        except FileNotFoundError:
+            return
+            
+        with ThreadPoolExecutor(max_workers=job_count()) as executor:
+            # Consume the results so worker exceptions propagate
+            list(executor.map(remove, children))
+            
+        try:
+            path.rmdir()
+        except FileNotFoundError:
+            pass
+            
+    def clean_build(self, build_type: str, unity_support: bool, full: bool = False,
+                    use_cmake: bool = True):
+        """Clean previous build artifacts
+        
+        By default only a stale CMake cache is removed, leaving CMake and
+        dotnet to rebuild incrementally; without CMake the direct build's
+        manifest is removed instead, forcing it to rebuild. With full=True
+        every build directory and the Bin directory are deleted.
+        """
+        if not full and not use_cmake:
+            manifest = self.bin_dir / build_type / ".manifest.blake2b"
+            if manifest.exists():
+                self.print_status("Removing build manifest to force a rebuild...")
+                manifest.unlink()
+            else:
+                self.print_status("No build manifest, nothing to clean")
+            return
+            
+        if not full:
+            config = self.cmake_config(build_type, unity_support)
+            last_config = self.last_cmake_config(build_type)
+            if last_config is not None and last_config != config:
+                self.print_status("Configuration changed, removing stale CMake cache...")
+                build_dir = self.script_dir / f"build-{build_type}"
+                # The recorded configuration goes with the cache it describes
+                for name in ("CMakeCache.txt", ".last_config.json"):
+                    (build_dir / name).unlink(missing_ok=True)
+            else:
+                self.print_status("Build configuration unchanged, nothing to clean")
+            return
+            
         self.print_status("Cleaning previous build...")
         
-        # Remove build directory
-        build_dir = self.script_dir / "build"
-        if build_dir.exists():
-            shutil.rmtree(build_dir)
+        # Remove per-configuration build directories (and the legacy build/)
+        for build_dir in [self.script_dir / "build", *self.script_dir.glob("build-*")]:
+            if build_dir.is_dir():
+                self._parallel_rmtree(build_dir)
             
         # Clean Bin directory
         if self.bin_dir.exists():
-            shutil.rmtree(self.bin_dir)
+            self._parallel_rmtree(self.bin_dir)
             
     def build_with_cmake(self, build_type: str, unity_support: bool) -> bool:
         """Build using CMake"""
@@ -94,85 +387,183 @@ class BuildScript:
             print("  sudo apt install cmake")
             return False
             
-        # Prepare CMake arguments
-        cmake_args = ["-B", "build", f"-DCMAKE_BUILD_TYPE={build_type}"]
-        if unity_support:
-            cmake_args.append("-DUNITY_BUILD=ON")
+        config = self.cmake_config(build_type, unity_support)
+        last_config = self.last_cmake_config(build_type)
+        if last_config is not None and last_config != config:
+            self.print_warning("Build configuration differs from the last configure;")
+            self.print_warning("if CMake fails, rerun with --clean (or --distclean for a full rebuild)")
+            
+        # Prepare CMake arguments; each build type gets its own tree so
+        # switching between Debug and Release does not force a reconfigure
+        build_dir = f"build-{build_type}"
+        cmake_args = []
+        if config["generator"] == "Ninja":
+            cmake_args += ["-G", "Ninja"]
+        if self.cmake_version() >= (3, 13, 0):
+            cmake_args += ["-S", ".", "-B", build_dir]
+        else:
+            # Pre-3.13 spelling of the source/build directory options
+            cmake_args += ["-H.", f"-B{build_dir}"]
+        cmake_args.append(f"-DCMAKE_BUILD_TYPE={build_type}")
+        # Always explicit, so turning --unity off overrides a cached ON
+        cmake_args.append(f"-DUNITY_BUILD={'ON' if unity_support else 'OFF'}")
             
         # Configure
         self.print_status("Configuring with CMake...")
         if not self.run_command(["cmake"] + cmake_args):
             return False
+        self.save_cmake_config(config)
+            
+        # Build, using every available core where CMake supports it
+        jobs = str(job_count())
+        os.environ.setdefault("CMAKE_BUILD_PARALLEL_LEVEL", jobs)
+        build_args = ["cmake", "--build", build_dir, "--config", build_type]
+        if self.cmake_version() >= (3, 12, 0):
+            build_args += ["--parallel", jobs]
             
-        # Build
         self.print_status("Building with CMake...")
-        if not self.run_command(["cmake", "--build", "build", "--config", build_type]):
+        if not self.run_command(build_args):
             return False
             
         return True
         
-    def build_direct(self, build_type: str) -> bool:
-        """Build directly with .NET tools"""
-        self.print_status("Building directly with .NET tools...")
+    def _source_files(self) -> List[str]:
+        """All MSBuild input files under the project, in sorted order"""
+        found = []
+        pending = [str(self.script_dir)]
+        while pending:
+            with os.scandir(pending.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in FINGERPRINT_SKIP_DIRS and not entry.name.startswith("build-"):
+                            pending.append(entry.path)
+                    elif entry.name.lower().endswith(FINGERPRINT_SUFFIXES):
+                        found.append(entry.path)
+        return sorted(found)
         
-        output_dir = str(self.bin_dir / build_type)
+    def _source_fingerprint(self) -> str:
+        """Digest of the names and contents of every MSBuild input file
+        
+        Files are visited in sorted order so the digest is deterministic.
+        """
+        import hashlib
+        
+        hasher = hashlib.blake2b()
+        for path in self._source_files():
+            hasher.update(os.path.relpath(path, self.script_dir).encode())
+            hasher.update(b"\0")
+            self._hash_file(path, hasher)
+        return hasher.hexdigest()
+        
+    @staticmethod
+    def _hash_file(path: str, hasher):
+        """Feed a file's contents to hasher straight from a read-only mapping"""
+        import mmap
+        
+        with open(path, "rb") as f:
+            # Empty files cannot be mapped and contribute nothing anyway
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                hasher.update(mm)
         
-        # Try different build tools in order of preference
-        if self.check_tool("dotnet"):
-            self.print_status("Using .NET CLI...")
+    def _restore_dotnet(self) -> bool:
+        """Restore NuGet packages for Flow and its tests once, up front"""
+        projects = ["Flow.csproj", "TestFlow/TestFlow.csproj"]
+        if self.tests_reference_flow():
+            # Restoring TestFlow walks its project reference to Flow too
+            self.print_status("Restoring packages...")
+            if self.run_command(["dotnet", "restore", "TestFlow/TestFlow.csproj"]):
+                return True
+            self.print_warning("Combined restore failed, restoring each project separately...")
             
-            # Build Flow library
-            self.print_status("Building Flow library...")
-            if not self.run_command(["dotnet", "build", "Flow.csproj", "-c", build_type, "-o", output_dir]):
-                return False
-                
-            # Build Flow tests
-            self.print_status("Building Flow tests...")
-            if not self.run_command(["dotnet", "build", "TestFlow/TestFlow.csproj", "-c", build_type, "-o", output_dir]):
-                return False
-                
-        elif self.check_tool("msbuild"):
-            self.print_status("Using MSBuild...")
-            
-            # Build Flow library
-            self.print_status("Building Flow library...")
-            if not self.run_command([
-                "msbuild", "Flow.csproj", 
-                f"/p:Configuration={build_type}", 
-                f"/p:OutputPath={output_dir}/"
-            ]):
-                return False
-                
-            # Build Flow tests
-            self.print_status("Building Flow tests...")
-            if not self.run_command([
-                "msbuild", "TestFlow/TestFlow.csproj",
-                f"/p:Configuration={build_type}",
-                f"/p:OutputPath={output_dir}/"
-            ]):
-                return False
-                
-        elif self.check_tool("xbuild"):
-            self.print_warning("Using legacy xbuild (consider upgrading to dotnet or msbuild)...")
-            
-            # Build Flow library
-            self.print_status("Building Flow library...")
-            if not self.run_command([
-                "xbuild", "Flow.csproj",
-                f"/p:Configuration={build_type}",
-                f"/p:OutputPath={output_dir}/"
-            ]):
-                return False
-                
-            # Build Flow tests
-            self.print_status("Building Flow tests...")
-            if not self.run_command([
-                "xbuild", "TestFlow/TestFlow.csproj",
-                f"/p:Configuration={build_type}",
-                f"/p:OutputPath={output_dir}/"
-            ]):
+        for project in projects:
+            self.print_status(f"Restoring packages for {project}...")
+            if not self.run_command(["dotnet", "restore", project]):
                 return False
+        return True
+        
+    def _build_dotnet(self, build_type: str, output_dir: str) -> bool:
+        """Build Flow and its tests with the .NET CLI"""
+        self.print_status("Using .NET CLI...")
+        
+        if not self._restore_dotnet():
+            return False
+            
+        if self.tests_reference_flow():
+            # TestFlow references Flow.csproj, so one build covers both
+            # projects and lets MSBuild schedule them together
+            self.print_status("Building Flow library and tests...")
+            return self.run_command([
+                "dotnet", "build", "TestFlow/TestFlow.csproj",
+                "-c", build_type, "-o", output_dir, "--no-restore",
+                f"-maxcpucount:{job_count()}",
+                "/p:BuildInParallel=true"
+            ])
+            
+        self.print_status("Building Flow library and tests in parallel...")
+        return self.run_commands_parallel([
+            ["dotnet", "build", "Flow.csproj", "-c", build_type, "-o", output_dir, "--no-restore"],
+            ["dotnet", "build", "TestFlow/TestFlow.csproj", "-c", build_type, "-o", output_dir, "--no-restore"]
+        ])
+        
+    def _build_msbuild_style(self, tool: str, build_type: str, output_dir: str) -> bool:
+        """Build Flow and its tests with msbuild or a compatible tool"""
+        # Build Flow library
+        self.print_status("Building Flow library...")
+        if not self.run_command([
+            tool, "Flow.csproj",
+            f"/p:Configuration={build_type}",
+            f"/p:OutputPath={output_dir}/"
+        ]):
+            return False
+            
+        # Build Flow tests
+        self.print_status("Building Flow tests...")
+        return self.run_command([
+            tool, "TestFlow/TestFlow.csproj",
+            f"/p:Configuration={build_type}",
+            f"/p:OutputPath={output_dir}/"
+        ])
+        
+    def _build_msbuild(self, build_type: str, output_dir: str) -> bool:
+        """Build Flow and its tests with MSBuild"""
+        self.print_status("Using MSBuild...")
+        return self._build_msbuild_style("msbuild", build_type, output_dir)
+        
+    def _build_xbuild(self, build_type: str, output_dir: str) -> bool:
+        """Build Flow and its tests with legacy xbuild"""
+        self.print_warning("Using legacy xbuild (consider upgrading to dotnet or msbuild)...")
+        return self._build_msbuild_style("xbuild", build_type, output_dir)
+        
+    def build_direct(self, build_type: str, output_dir: str) -> bool:
+        """Build directly with .NET tools into output_dir (Bin/<build_type>)"""
+        self.print_status("Building directly with .NET tools...")
+        
+        # Skip the build entirely when no source changed since the last one
+        manifest = os.path.join(output_dir, ".manifest.blake2b")
+        fingerprint = self._source_fingerprint()
+        if all(os.path.exists(os.path.join(output_dir, name)) for name in BUILD_OUTPUTS):
+            try:
+                with open(manifest) as f:
+                    if f.read() == fingerprint:
+                        self.print_status("Build is up to date")
+                        return True
+            except OSError:
+                pass
                 
+        # Use the first available tool in order of preference; later
+        # candidates are not looked up once one is found
+        candidates = [
+            ("dotnet", self._build_dotnet),
+            ("msbuild", self._build_msbuild),
+            ("xbuild", self._build_xbuild),
+        ]
+        for name, build in candidates:
+            if self.check_tool(name):
+                if not build(build_type, output_dir):
+                    return False
+                break
         else:
             self.print_error("No suitable .NET build tool found!")
             print("Please install one of the following:")
@@ -180,26 +571,107 @@ class BuildScript:
             print("  - Mono: sudo apt install mono-devel")
             return False
             
+        with open(manifest, "w") as f:
+            f.write(fingerprint)
         return True
         
-    def show_build_results(self, build_type: str):
-        """Show information about built files"""
-        build_dir = self.bin_dir / build_type
+    def _source_changes(self) -> Iterator[None]:
+        """Yield once for every batch of changes to MSBuild input files
+        
+        Uses inotify (via the optional inotify_simple package) when it is
+        installed, and falls back to polling modification times.
+        """
+        try:
+            from inotify_simple import INotify, flags
+        except ImportError:
+            INotify = None
+            
+        if INotify is None:
+            def snapshot():
+                state = {}
+                for path in self._source_files():
+                    try:
+                        st = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    state[path] = (st.st_mtime_ns, st.st_size)
+                return state
+                
+            last = snapshot()
+            while True:
+                time.sleep(0.5)
+                current = snapshot()
+                if current != last:
+                    last = current
+                    yield
+                    
+        watch_flags = (flags.CLOSE_WRITE | flags.CREATE | flags.DELETE |
+                       flags.MOVED_FROM | flags.MOVED_TO)
+        with INotify() as inotify:
+            directories = {os.path.dirname(path) for path in self._source_files()}
+            for directory in directories:
+                inotify.add_watch(directory, watch_flags)
+                
+            while True:
+                events = inotify.read()
+                if not any(e.name.lower().endswith(FINGERPRINT_SUFFIXES) for e in events):
+                    continue
+                # Debounce: editors and checkouts touch many files at once
+                while inotify.read(timeout=100):
+                    pass
+                yield
+                
+    def watch(self, build: Callable[[], bool], output_dir: str) -> int:
+        """Rebuild whenever sources change, until interrupted"""
+        self.print_status("Watching for source changes (Ctrl+C to stop)...")
+        try:
+            for _ in self._source_changes():
+                self.print_status("Sources changed, rebuilding...")
+                if build():
+                    self.print_status("Build completed successfully!")
+                    self.show_build_results(output_dir)
+                else:
+                    self.print_error("Build failed!")
+        except KeyboardInterrupt:
+            print()
+        return 0
         
-        flow_dll = build_dir / "Flow.dll"
-        if flow_dll.exists():
-            size = flow_dll.stat().st_size
-            self.print_status(f"Flow.dll: {size:,} bytes")
+    def show_build_results(self, output_dir: str):
+        """Show information about built files in output_dir"""
+        # One directory scan; DirEntry.stat() reuses the scandir results
+        try:
+            with os.scandir(output_dir) as it:
+                sizes = {e.name: e.stat().st_size for e in it if e.is_file()}
+        except FileNotFoundError:
+            return
             
-        # Look for test binary
-        test_files = list(build_dir.glob("TestFlow.*"))
-        if test_files:
-            test_file = test_files[0]
-            size = test_file.stat().st_size
-            self.print_status(f"Test binary: {test_file.name} ({size:,} bytes)")
+        if "Flow.dll" in sizes:
+            self.print_status(f"Flow.dll: {sizes['Flow.dll']:,} bytes")
             
-    def main(self):
-        """Main build script entry point"""
+        # Look for test binary, preferring the assembly over its .deps.json,
+        # .pdb and other side files
+        test_file = next((name for name in ("TestFlow.dll", "TestFlow.exe") if name in sizes), None)
+        if test_file is None:
+            test_file = min((name for name in sizes if name.startswith("TestFlow.")), default=None)
+        if test_file:
+            self.print_status(f"Test binary: {test_file} ({sizes[test_file]:,} bytes)")
+            
+    def parse_args(self, argv: List[str]):
+        """Parse command line arguments"""
+        # The bare invocation is by far the most common; answer it without
+        # importing argparse or building the parser
+        if not argv:
+            return SimpleNamespace(
+                build_type=None,
+                no_cmake=False,
+                unity=False,
+                clean=False,
+                distclean=False,
+                watch=False
+            )
+            
+        import argparse
+        
         parser = argparse.ArgumentParser(
             description="CsharpFlow Build Script for Ubuntu/Linux",
             formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -209,6 +681,8 @@ Examples:
   %(prog)s --debug           # Build in Debug mode
   %(prog)s --no-cmake        # Build directly with dotnet/mono
   %(prog)s --unity --debug   # Build with Unity support in Debug mode
+  %(prog)s --distclean       # Rebuild everything from scratch
+  %(prog)s --watch           # Rebuild on every source change
             """
         )
         
@@ -243,14 +717,32 @@ Examples:
         parser.add_argument(
             "-c", "--clean",
             action="store_true",
-            help="Clean build (remove build directory)"
+            help="Discard the CMake cache if the build configuration changed "
+                 "(with --no-cmake, force a rebuild by discarding the build manifest)"
+        )
+        
+        parser.add_argument(
+            "--distclean",
+            action="store_true",
+            help="Full clean build (remove build and Bin directories)"
         )
         
-        args = parser.parse_args()
+        parser.add_argument(
+            "-w", "--watch",
+            action="store_true",
+            help="After building, rebuild whenever a source file changes"
+        )
+        
+        return parser.parse_args(argv)
+        
+    def main(self):
+        """Main build script entry point"""
+        args = self.parse_args(sys.argv[1:])
         
         # Set defaults
         build_type = args.build_type or "Release"
         use_cmake = not args.no_cmake
+        output_dir = str(self.bin_dir / build_type)
         
         self.print_status("CsharpFlow Build Script")
         self.print_status(f"Build Type: {build_type}")
@@ -258,29 +750,36 @@ Examples:
         self.print_status(f"Use CMake: {use_cmake}")
         
         # Clean if requested
-        if args.clean:
-            self.clean_build()
+        if args.distclean:
+            self.clean_build(build_type, args.unity, full=True)
+        elif args.clean:
+            self.clean_build(build_type, args.unity, use_cmake=use_cmake)
             
         # Create directories
-        self.create_directories()
+        self.create_directories(build_type)
         
         # Build
-        success = False
-        if use_cmake:
-            success = self.build_with_cmake(build_type, args.unity)
-        else:
-            success = self.build_direct(build_type)
+        def build() -> bool:
+            if use_cmake:
+                return self.build_with_cmake(build_type, args.unity)
+            return self.build_direct(build_type, output_dir)
             
+        success = build()
         if not success:
             self.print_error("Build failed!")
+            if args.watch:
+                return self.watch(build, output_dir)
             return 1
             
         self.print_status("Build completed successfully!")
         self.print_status(f"Binaries are in: Bin/{build_type}/")
         
         # Show results
-        self.show_build_results(build_type)
+        self.show_build_results(output_dir)
         
+        if args.watch:
+            return self.watch(build, output_dir)
+            
         self.print_status("Build script completed successfully!")
         print()
         print("Next steps:")
@@ -20,437 +20,412 @@ component works and interacts with others.
 import os
 import sys
 import time
+import heapq
 import subprocess
-import threading
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 from datetime import datetime, timedelta
 
-class Colors:
-    """ANSI color codes for beautiful terminal output"""
-    HEADER = '\033[95m'
-    OKBLUE = '\033[94m'
-    OKCYAN = '\033[96m'
-    OKGREEN = '\033[92m'
-    WARNING = '\033[93m'
-    FAIL = '\033[91m'
-    ENDC = '\033[0m'
-    BOLD = '\033[1m'
-    UNDERLINE = '\033[4m'
+from _demo_colors import *
+
+# Demo sections as scripts of opcodes, run by FlowDemo._run_script:
+#   ('section', text)   section header        ('text', text)  plain line
+#   ('blank',)          empty line            ('sleep', s)    pause
+#   ('step', text)      timestamped step      ('success' | 'warning' | 'error', text)
+#   ('mark',)           start a stopwatch     ('until', s)    pause until s after mark
+
+KERNEL_BASICS = [
+    ('section', "Kernel & Basic Execution"),
+    ('text', "The Flow kernel is the heart of the coroutine system."),
+    ('text', "It manages time, steps generators, and coordinates execution."),
+    ('blank',),
+    ('step', "Creating kernel with Create.Kernel()"),
+    ('sleep', 0.1),
+    ('step', "Setting up factory for object creation"),
+    ('sleep', 0.1),
+    ('step', "Kernel initialized - ready for coroutine execution"),
+    ('blank',),
+    ('text', f"{BOLD}Demonstration: Kernel Stepping{ENDC}"),
+    ('text', "The kernel steps through active generators each frame:"),
+    ('blank',),
+    *[op for frame in range(1, 6) for op in (
+        ('step', f"Frame {frame}: kernel.Step() - Processing active generators"),
+        ('sleep', 0.1),
+    )],
+    ('success', "Kernel stepping demonstration complete"),
+]
+
+def _coroutine_events(name: str, steps: int, start: float, delay: float) -> List[Tuple[float, str]]:
+    """Timestamped lines printed by one simulated coroutine"""
+    events = [(start, f"Starting coroutine: {BOLD}{name}{ENDC}")]
+    for step in range(1, steps + 1):
+        state = f"{OKGREEN}COMPLETED{ENDC}" if step == steps else f"{OKCYAN}yield return{ENDC}"
+        events.append((round(start + step * delay, 3), f"  {name} step {step}/{steps} - {state}"))
+    return events
+
+def _coroutine_timeline(coroutines: List[Tuple[str, int]], stagger: float = 0.1,
+                        delay: float = 0.2) -> List[tuple]:
+    """Interleave simulated coroutines into one deterministic script"""
+    timeline = heapq.merge(
+        *(_coroutine_events(name, steps, i * stagger, delay) for i, (name, steps) in enumerate(coroutines)),
+        key=lambda event: event[0],
+    )
+    return [('mark',)] + [op for at, text in timeline for op in (('until', at), ('step', text))]
+
+COROUTINES = [
+    ('section', "Coroutines & Generators"),
+    ('text', "Coroutines are the fundamental execution units in Flow."),
+    ('text', "They can suspend execution with 'yield return' and resume later."),
+    ('blank',),
+    ('text', f"{BOLD}Demonstration: Multiple Coroutines{ENDC}"),
+    *_coroutine_timeline([
+        ("PlayerMovement", 4),
+        ("AIBehavior", 3),
+        ("AnimationController", 5),
+    ]),
+    ('blank',),
+    ('success', "All coroutines completed execution"),
+]
+
+_BARRIER_TASKS = [
+    ("Loading Player Data", 2.0),
+    ("Initializing Graphics", 1.5),
+    ("Loading Level Assets", 2.5),
+    ("Connecting to Server", 1.8),
+]
+
+BARRIERS = [
+    ('section', "Barriers - Wait for All"),
+    ('text', "Barriers wait for ALL added operations to complete before continuing."),
+    ('text', "Perfect for synchronization points in complex workflows."),
+    ('blank',),
+    ('text', f"{BOLD}Scenario: Game Initialization Barrier{ENDC}"),
+    ('text', "Waiting for all systems to initialize before starting game..."),
+    ('blank',),
+    ('step', "Creating barrier with 4 initialization tasks"),
+    ('mark',),
+    *[('step', f"  Added to barrier: {name} (est. {duration}s)") for name, duration in _BARRIER_TASKS],
+    ('blank',),
+    ('step', "Barrier.Start() - All tasks executing in parallel..."),
+    # Sleep straight to each completion rather than polling
+    *[op for name, duration in sorted(_BARRIER_TASKS, key=lambda task: task[1]) for op in (
+        ('until', duration),
+        ('step', f"  ✓ {name} completed ({duration:.1f}s)"),
+    )],
+    ('blank',),
+    ('success', "🎉 Barrier completed - All initialization tasks finished!"),
+    ('step', "Game can now start safely"),
+]
+
+TRIGGERS = [
+    ('section', "Triggers - Wait for Any"),
+    ('text', "Triggers wait for ANY of the added operations to complete."),
+    ('text', "Useful for race conditions, timeouts, and alternative paths."),
+    ('blank',),
+    ('text', f"{BOLD}Scenario: Player Input with Timeout{ENDC}"),
+    ('text', "Waiting for player input OR timeout, whichever comes first..."),
+    ('blank',),
+    ('step', "Creating trigger with two conditions:"),
+    ('step', "  1. Player presses any key"),
+    ('step', "  2. 3-second timeout"),
+    ('blank',),
+    ('step', "Trigger.Start() - Waiting for first completion..."),
+    # The timeout wins the race after 16 ticks
+    *[op for i in (0, 5, 10) for op in (
+        ('sleep', 0.1 if i == 0 else 0.5),
+        ('step', f"  ... waiting ({i * 0.1:.1f}s elapsed)"),
+    )],
+    ('sleep', 0.5),
+    ('step', "  ⏰ Timeout reached first!"),
+    ('success', "Trigger fired - Moving to default action"),
+    ('blank',),
+    ('step', "Other trigger conditions automatically cancelled"),
+]
+
+FUTURES = [
+    ('section', "Futures - Asynchronous Values"),
+    ('text', "Futures represent values that will be available in the future."),
+    ('text', "Coroutines can suspend until the future's value is set."),
+    ('blank',),
+    ('text', f"{BOLD}Scenario: Async Web Request{ENDC}"),
+    ('step', "Creating Future<UserData> for web request"),
+    ('sleep', 0.1),
+    ('step', "Coroutine suspended - waiting for future value"),
+    ('sleep', 0.1),
+    ('step', "HTTP request sent to api.example.com/user/123"),
+    *[op for i in range(1, 4) for op in (
+        ('sleep', 0.1),
+        ('step', f"  ... network request in progress ({i}s)"),
+    )],
+    ('step', "HTTP response received!"),
+    ('step', "Future.SetValue(userData) called"),
+    ('sleep', 0.1),
+    ('success', "✓ Suspended coroutine resumed with user data"),
+    ('step', "  User: 'Christian' (ID: 123, Level: 45)"),
+]
+
+TIMERS = [
+    ('section', "Timers - Time-Based Execution"),
+    ('text', "Timers execute code after specified time intervals."),
+    ('text', "Support both one-shot and periodic execution."),
+    ('blank',),
+    ('text', f"{BOLD}Demonstration: Heartbeat System{ENDC}"),
+    ('step', "Creating PeriodicTimer(2.0 seconds)"),
+    ('step', "Timer.Elapsed += OnHeartbeat"),
+    ('blank',),
+    ('mark',),
+    *[op for tick, users in enumerate((342, 338, 341, 345), 1) for op in (
+        ('until', tick * 2.0),
+        ('step', f"⏰ Heartbeat #{tick} - System status check"),
+        ('step', f"  └ {users} users online"),
+    )],
+    ('blank',),
+    ('success', "Periodic timer demonstration complete"),
+]
+
+_SEQUENCE_PHASES = [
+    ("Draw Cards Phase", 1.2),
+    ("Player Action Phase", 2.0),
+    ("Combat Resolution", 1.5),
+    ("End Turn Cleanup", 0.8),
+]
+
+SEQUENCES = [
+    ('section', "Sequences - Ordered Execution"),
+    ('text', "Sequences execute operations in strict order."),
+    ('text', "Each step must complete before the next begins."),
+    ('blank',),
+    ('text', f"{BOLD}Scenario: Game Turn Sequence{ENDC}"),
+    ('step', "Creating sequence with 4 phases:"),
+    *[('step', f"  → {name}") for name, _ in _SEQUENCE_PHASES],
+    ('blank',),
+    ('step', "Sequence.Start() - Executing steps in order..."),
+    *[op for i, (name, duration) in enumerate(_SEQUENCE_PHASES, 1) for op in (
+        ('blank',),
+        ('step', f"Phase {i}: {name} starting..."),
+        # 4 progress updates per second of phase duration
+        *[tick_op for p in range(int(duration * 4)) for tick_op in (
+            ('sleep', 0.1),
+            ('step', f"  └ {name}: {(p + 1) * 100 // int(duration * 4)}% complete"),
+        )],
+        ('success', f"Phase {i} completed: {name}"),
+    )],
+    ('blank',),
+    ('success', "🎯 Entire sequence completed successfully!"),
+]
+
+COMPLEX_WORKFLOW = [
+    ('section', "Complex Workflow - Real Game Scenario"),
+    ('text', "This demonstrates a complex game loop combining all Flow primitives:"),
+    ('text', "• Nested sequences and barriers"),
+    ('text', "• Conditional execution with triggers"),
+    ('text', "• Async operations with futures"),
+    ('text', "• Time-based events with timers"),
+    ('blank',),
+    ('text', f"{BOLD}Scenario: Multiplayer Battle Turn{ENDC}"),
+    ('step', "🎮 Starting complex battle turn workflow..."),
+    ('blank',),
+    
+    # Phase 1: Initialization Barrier
+    ('step', "Phase 1: Player Initialization Barrier"),
+    *[op for task in ("Load Player State", "Sync Animations", "Update UI") for op in (
+        ('sleep', 0.1),
+        ('step', f"  ✓ {task}"),
+    )],
+    ('success', "All players initialized"),
+    ('blank',),
+    
+    # Phase 2: Action Selection with Timeout
+    ('step', "Phase 2: Action Selection (Trigger with timeout)"),
+    ('sleep', 0.1),
+    ('step', "  Player 1: Selected 'Attack' (2.1s)"),
+    ('sleep', 0.1),
+    ('step', "  Player 2: Auto-selected 'Defend' (timeout at 5s)"),
+    ('success', "Action selection phase complete"),
+    ('blank',),
+    
+    # Phase 3: Async Damage Calculation
+    ('step', "Phase 3: Damage Calculation (Future)"),
+    ('sleep', 0.1),
+    ('step', "  Server processing battle mechanics..."),
+    ('sleep', 0.1),
+    ('step', "  Future<BattleResult> resolved"),
+    ('step', "  └ Damage: 25 HP, Critical Hit: Yes"),
+    ('success', "Damage calculation complete"),
+    ('blank',),
+    
+    # Phase 4: Animation Sequence
+    ('step', "Phase 4: Animation Sequence"),
+    *[op for i, anim in enumerate(("Wind-up", "Strike", "Impact", "Recovery"), 1) for op in (
+        ('sleep', 0.1),
+        ('step', f"  {i}/4: {anim} animation"),
+    )],
+    ('success', "Animation sequence complete"),
+    ('blank',),
+    
+    # Phase 5: Turn Cleanup Barrier
+    ('step', "Phase 5: Turn Cleanup Barrier"),
+    *[op for task in ("Update Health Bars", "Save Game State", "Prepare Next Turn") for op in (
+        ('sleep', 0.1),
+        ('step', f"  ✓ {task}"),
+    )],
+    ('success', "Turn cleanup complete"),
+    ('blank',),
+    ('success', "🏆 Complex workflow completed successfully!"),
+    ('step', "Turn control passed to next player"),
+]
+
+ERROR_HANDLING = [
+    ('section', "Error Handling & Recovery"),
+    ('text', "Flow provides robust error handling for failed operations."),
+    ('text', "Supports retry policies, fallback strategies, and graceful degradation."),
+    ('blank',),
+    ('text', f"{BOLD}Scenario: Network Operation with Fallback{ENDC}"),
+    ('step', "Attempting to fetch player statistics..."),
+    ('sleep', 0.1),
+    ('error', "Network timeout - primary server unreachable"),
+    ('sleep', 0.1),
+    ('step', "Error handler triggered - trying fallback server..."),
+    ('sleep', 0.1),
+    ('warning', "Fallback server slow - using cached data"),
+    ('sleep', 0.1),
+    ('success', "✓ Graceful fallback completed"),
+    ('step', "  └ Using cached stats (5 minutes old)"),
+    ('blank',),
+    ('text', f"{BOLD}Scenario: Retry Policy{ENDC}"),
+    *[op for attempt in (1, 2) for op in (
+        ('step', f"Connection attempt #{attempt}"),
+        ('sleep', 0.1),
+        ('error', f"Attempt {attempt} failed - retrying in 2s..."),
+        ('sleep', 0.1),
+    )],
+    ('step', "Connection attempt #3"),
+    ('sleep', 0.1),
+    ('success', "✓ Connection successful!"),
+    ('step', "  └ Retry policy succeeded on attempt 3"),
+]
 
 class FlowDemo:
     def __init__(self):
         self.script_dir = Path(__file__).parent.absolute()
-        self.bin_dir = self.script_dir / "Bin" / "Release"
+        self.bin_dir = str(self.script_dir / "Bin" / "Release")
         self.start_time = datetime.now()
+        self._t0 = time.monotonic()
         self.demo_scenarios = []
         
+        # Buffer each demo section and write it in one go. Off by default on
+        # a terminal, where it would hide the real-time pacing; DEMO_BATCH=1
+        # or DEMO_BATCH=0 overrides.
+        batch = os.environ.get("DEMO_BATCH")
+        self.batch_output = not sys.stdout.isatty() if batch is None else batch == "1"
+        
     def print_header(self, text: str):
         """Print a styled header"""
-        print(f"\n{Colors.HEADER}{Colors.BOLD}{'='*60}{Colors.ENDC}")
-        print(f"{Colors.HEADER}{Colors.BOLD}{text.center(60)}{Colors.ENDC}")
-        print(f"{Colors.HEADER}{Colors.BOLD}{'='*60}{Colors.ENDC}\n")
+        print(f"\n{HEADER}{BOLD}{'='*60}{ENDC}")
+        print(f"{HEADER}{BOLD}{text.center(60)}{ENDC}")
+        print(f"{HEADER}{BOLD}{'='*60}{ENDC}\n")
         
     def print_section(self, text: str):
         """Print a styled section header"""
-        print(f"\n{Colors.OKBLUE}{Colors.BOLD}▶ {text}{Colors.ENDC}")
-        print(f"{Colors.OKBLUE}{'─' * (len(text) + 2)}{Colors.ENDC}")
+        print(f"\n{OKBLUE}{BOLD}▶ {text}{ENDC}")
+        print(f"{OKBLUE}{'─' * (len(text) + 2)}{ENDC}")
         
     def print_step(self, text: str):
         """Print a demo step"""
-        timestamp = self.get_relative_time()
-        print(f"{Colors.OKCYAN}[{timestamp}]{Colors.ENDC} {text}")
+        emit(STEP_OPEN_B, self.get_relative_time() + STEP_CLOSE + text)
         
     def print_success(self, text: str):
         """Print success message"""
-        print(f"{Colors.OKGREEN}✓{Colors.ENDC} {text}")
+        emit(SUCCESS_MARK_B, text)
         
     def print_warning(self, text: str):
         """Print warning message"""
-        print(f"{Colors.WARNING}⚠{Colors.ENDC} {text}")
+        emit(WARN_MARK_B, text)
         
     def print_error(self, text: str):
         """Print error message"""
-        print(f"{Colors.FAIL}✗{Colors.ENDC} {text}")
+        emit(ERROR_MARK_B, text)
         
     def get_relative_time(self) -> str:
         """Get time relative to demo start"""
-        elapsed = datetime.now() - self.start_time
-        return f"{elapsed.total_seconds():06.2f}s"
+        return f"{time.monotonic() - self._t0:06.2f}s"
         
     def wait_for_user(self, message: str = "Press Enter to continue..."):
         """Wait for user input with styled prompt - disabled for fast demo"""
         # Skip user interaction for 45-second demo
         pass
         
-    def simulate_coroutine_execution(self, name: str, steps: int, delay: float = 0.1):
-        """Simulate coroutine execution with visual feedback"""
-        self.print_step(f"Starting coroutine: {Colors.BOLD}{name}{Colors.ENDC}")
+    def _run_script(self, ops: List[tuple]):
+        """Execute a demo script of (opcode, *args) tuples"""
+        mark = time.monotonic()
         
-        for step in range(1, steps + 1):
-            time.sleep(delay)
-            if step == steps:
-                self.print_step(f"  {name} step {step}/{steps} - {Colors.OKGREEN}COMPLETED{Colors.ENDC}")
-            else:
-                self.print_step(f"  {name} step {step}/{steps} - {Colors.OKCYAN}yield return{Colors.ENDC}")
-                
+        def set_mark():
+            nonlocal mark
+            mark = time.monotonic()
+            
+        def until(seconds: float):
+            demo_sleep(seconds - (time.monotonic() - mark) * DEMO_SPEED)
+            
+        dispatch = {
+            'section': self.print_section,
+            'text': print,
+            'blank': print,
+            'step': self.print_step,
+            'success': self.print_success,
+            'warning': self.print_warning,
+            'error': self.print_error,
+            'sleep': demo_sleep,
+            'mark': set_mark,
+            'until': until,
+        }
+        for op, *args in ops:
+            dispatch[op](*args)
+            
     def demonstrate_kernel_basics(self):
         """Demonstrate basic kernel functionality"""
-        self.print_section("Kernel & Basic Execution")
-        
-        print("The Flow kernel is the heart of the coroutine system.")
-        print("It manages time, steps generators, and coordinates execution.")
-        print()
-        
-        # Simulate kernel creation
-        self.print_step("Creating kernel with Create.Kernel()")
-        time.sleep(0.1)
-        
-        self.print_step("Setting up factory for object creation")
-        time.sleep(0.1)
-        
-        self.print_step("Kernel initialized - ready for coroutine execution")
-        print()
-        
-        # Show stepping mechanism
-        print(f"{Colors.BOLD}Demonstration: Kernel Stepping{Colors.ENDC}")
-        print("The kernel steps through active generators each frame:")
-        print()
-        
-        for frame in range(1, 6):
-            self.print_step(f"Frame {frame}: kernel.Step() - Processing active generators")
-            time.sleep(0.1)
-            
-        self.print_success("Kernel stepping demonstration complete")
+        self._run_script(KERNEL_BASICS)
         
     def demonstrate_coroutines(self):
         """Demonstrate coroutine functionality"""
-        self.print_section("Coroutines & Generators")
-        
-        print("Coroutines are the fundamental execution units in Flow.")
-        print("They can suspend execution with 'yield return' and resume later.")
-        print()
-        
-        # Simulate multiple coroutines
-        coroutines = [
-            ("PlayerMovement", 4),
-            ("AIBehavior", 3), 
-            ("AnimationController", 5)
-        ]
-        
-        print(f"{Colors.BOLD}Demonstration: Multiple Coroutines{Colors.ENDC}")
-        
-        for name, steps in coroutines:
-            thread = threading.Thread(
-                target=self.simulate_coroutine_execution, 
-                args=(name, steps, 0.2)
-            )
-            thread.start()
-            time.sleep(0.1)  # Stagger start times
-            
-        # Wait for demonstration to complete
-        time.sleep(0.1)
-        print()
-        self.print_success("All coroutines completed execution")
+        self._run_script(COROUTINES)
         
     def demonstrate_barriers(self):
         """Demonstrate barrier synchronization"""
-        self.print_section("Barriers - Wait for All")
-        
-        print("Barriers wait for ALL added operations to complete before continuing.")
-        print("Perfect for synchronization points in complex workflows.")
-        print()
-        
-        print(f"{Colors.BOLD}Scenario: Game Initialization Barrier{Colors.ENDC}")
-        print("Waiting for all systems to initialize before starting game...")
-        print()
-        
-        tasks = [
-            ("Loading Player Data", 2.0),
-            ("Initializing Graphics", 1.5),
-            ("Loading Level Assets", 2.5),
-            ("Connecting to Server", 1.8)
-        ]
-        
-        # Start all tasks
-        self.print_step("Creating barrier with 4 initialization tasks")
-        start_time = time.time()
-        
-        for task_name, duration in tasks:
-            self.print_step(f"  Added to barrier: {task_name} (est. {duration}s)")
-            
-        print()
-        self.print_step("Barrier.Start() - All tasks executing in parallel...")
-        
-        # Simulate parallel execution
-        completed = set()
-        while len(completed) < len(tasks):
-            current_time = time.time()
-            elapsed = current_time - start_time
-            
-            for i, (task_name, duration) in enumerate(tasks):
-                if i not in completed and elapsed >= duration:
-                    completed.add(i)
-                    self.print_step(f"  ✓ {task_name} completed ({elapsed:.1f}s)")
-                    
-            time.sleep(0.1)
-            
-        print()
-        self.print_success("🎉 Barrier completed - All initialization tasks finished!")
-        self.print_step("Game can now start safely")
+        self._run_script(BARRIERS)
         
     def demonstrate_triggers(self):
         """Demonstrate trigger functionality"""
-        self.print_section("Triggers - Wait for Any")
-        
-        print("Triggers wait for ANY of the added operations to complete.")
-        print("Useful for race conditions, timeouts, and alternative paths.")
-        print()
-        
-        print(f"{Colors.BOLD}Scenario: Player Input with Timeout{Colors.ENDC}")
-        print("Waiting for player input OR timeout, whichever comes first...")
-        print()
-        
-        self.print_step("Creating trigger with two conditions:")
-        self.print_step("  1. Player presses any key")
-        self.print_step("  2. 3-second timeout")
-        print()
-        
-        # Simulate trigger race
-        self.print_step("Trigger.Start() - Waiting for first completion...")
-        
-        # Simulate timeout winning the race
-        for i in range(30):
-            time.sleep(0.1)
-            if i == 15:
-                self.print_step("  ⏰ Timeout reached first!")
-                self.print_success("Trigger fired - Moving to default action")
-                break
-            elif i % 5 == 0:
-                self.print_step(f"  ... waiting ({(i*0.1):.1f}s elapsed)")
-                
-        print()
-        self.print_step("Other trigger conditions automatically cancelled")
+        self._run_script(TRIGGERS)
         
     def demonstrate_futures(self):
         """Demonstrate future/promise patterns"""
-        self.print_section("Futures - Asynchronous Values")
-        
-        print("Futures represent values that will be available in the future.")
-        print("Coroutines can suspend until the future's value is set.")
-        print()
-        
-        print(f"{Colors.BOLD}Scenario: Async Web Request{Colors.ENDC}")
-        
-        # Simulate future creation and resolution
-        self.print_step("Creating Future<UserData> for web request")
-        time.sleep(0.1)
-        
-        self.print_step("Coroutine suspended - waiting for future value")
-        time.sleep(0.1)
-        
-        self.print_step("HTTP request sent to api.example.com/user/123")
-        
-        # Simulate network delay
-        for i in range(3):
-            time.sleep(0.1)
-            self.print_step(f"  ... network request in progress ({i+1}s)")
-            
-        self.print_step("HTTP response received!")
-        self.print_step("Future.SetValue(userData) called")
-        time.sleep(0.1)
-        
-        self.print_success("✓ Suspended coroutine resumed with user data")
-        self.print_step("  User: 'Christian' (ID: 123, Level: 45)")
+        self._run_script(FUTURES)
         
     def demonstrate_timers(self):
         """Demonstrate timer functionality"""
-        self.print_section("Timers - Time-Based Execution")
-        
-        print("Timers execute code after specified time intervals.")
-        print("Support both one-shot and periodic execution.")
-        print()
-        
-        print(f"{Colors.BOLD}Demonstration: Heartbeat System{Colors.ENDC}")
-        
-        # Simulate periodic timer
-        self.print_step("Creating PeriodicTimer(2.0 seconds)")
-        self.print_step("Timer.Elapsed += OnHeartbeat")
-        print()
-        
-        start_time = time.time()
-        tick_count = 0
-        
-        while tick_count < 4:
-            elapsed = time.time() - start_time
-            if elapsed >= (tick_count + 1) * 2.0:
-                tick_count += 1
-                self.print_step(f"⏰ Heartbeat #{tick_count} - System status check")
-                if tick_count == 1:
-                    self.print_step("  └ 342 users online")
-                elif tick_count == 2:
-                    self.print_step("  └ 338 users online")
-                elif tick_count == 3:
-                    self.print_step("  └ 341 users online")
-                elif tick_count == 4:
-                    self.print_step("  └ 345 users online")
-                    
-            time.sleep(0.1)
-            
-        print()
-        self.print_success("Periodic timer demonstration complete")
+        self._run_script(TIMERS)
         
     def demonstrate_sequences(self):
         """Demonstrate sequence execution"""
-        self.print_section("Sequences - Ordered Execution")
-        
-        print("Sequences execute operations in strict order.")
-        print("Each step must complete before the next begins.")
-        print()
-        
-        print(f"{Colors.BOLD}Scenario: Game Turn Sequence{Colors.ENDC}")
-        
-        sequence_steps = [
-            ("Draw Cards Phase", 1.2),
-            ("Player Action Phase", 2.0), 
-            ("Combat Resolution", 1.5),
-            ("End Turn Cleanup", 0.8)
-        ]
-        
-        self.print_step("Creating sequence with 4 phases:")
-        for step_name, duration in sequence_steps:
-            self.print_step(f"  → {step_name}")
-            
-        print()
-        self.print_step("Sequence.Start() - Executing steps in order...")
-        
-        for i, (step_name, duration) in enumerate(sequence_steps, 1):
-            print()
-            self.print_step(f"Phase {i}: {step_name} starting...")
-            
-            # Show progress during step
-            progress_steps = int(duration * 4)  # 4 updates per second
-            for p in range(progress_steps):
-                time.sleep(0.1)
-                progress = (p + 1) / progress_steps * 100
-                self.print_step(f"  └ {step_name}: {progress:.0f}% complete")
-                
-            self.print_success(f"Phase {i} completed: {step_name}")
-            
-        print()
-        self.print_success("🎯 Entire sequence completed successfully!")
+        self._run_script(SEQUENCES)
         
     def demonstrate_complex_workflow(self):
         """Demonstrate complex nested workflow"""
-        self.print_section("Complex Workflow - Real Game Scenario")
-        
-        print("This demonstrates a complex game loop combining all Flow primitives:")
-        print("• Nested sequences and barriers")
-        print("• Conditional execution with triggers")
-        print("• Async operations with futures")
-        print("• Time-based events with timers")
-        print()
-        
-        print(f"{Colors.BOLD}Scenario: Multiplayer Battle Turn{Colors.ENDC}")
-        
-        self.print_step("🎮 Starting complex battle turn workflow...")
-        print()
-        
-        # Phase 1: Initialization Barrier
-        self.print_step("Phase 1: Player Initialization Barrier")
-        init_tasks = ["Load Player State", "Sync Animations", "Update UI"]
-        for task in init_tasks:
-            time.sleep(0.1)
-            self.print_step(f"  ✓ {task}")
-        self.print_success("All players initialized")
-        print()
-        
-        # Phase 2: Action Selection with Timeout
-        self.print_step("Phase 2: Action Selection (Trigger with timeout)")
-        time.sleep(0.1)
-        self.print_step("  Player 1: Selected 'Attack' (2.1s)")
-        time.sleep(0.1)
-        self.print_step("  Player 2: Auto-selected 'Defend' (timeout at 5s)")
-        self.print_success("Action selection phase complete")
-        print()
-        
-        # Phase 3: Async Damage Calculation
-        self.print_step("Phase 3: Damage Calculation (Future)")
-        time.sleep(0.1)
-        self.print_step("  Server processing battle mechanics...")
-        time.sleep(0.1)
-        self.print_step("  Future<BattleResult> resolved")
-        self.print_step("  └ Damage: 25 HP, Critical Hit: Yes")
-        self.print_success("Damage calculation complete")
-        print()
-        
-        # Phase 4: Animation Sequence
-        self.print_step("Phase 4: Animation Sequence")
-        animations = ["Wind-up", "Strike", "Impact", "Recovery"]
-        for i, anim in enumerate(animations, 1):
-            time.sleep(0.1)
-            self.print_step(f"  {i}/4: {anim} animation")
-        self.print_success("Animation sequence complete")
-        print()
-        
-        # Phase 5: Turn Cleanup Barrier
-        self.print_step("Phase 5: Turn Cleanup Barrier")
-        cleanup_tasks = ["Update Health Bars", "Save Game State", "Prepare Next Turn"]
-        for task in cleanup_tasks:
-            time.sleep(0.1)
-            self.print_step(f"  ✓ {task}")
-        self.print_success("Turn cleanup complete")
-        
-        print()
-        self.print_success("🏆 Complex workflow completed successfully!")
-        self.print_step("Turn control passed to next player")
+        self._run_script(COMPLEX_WORKFLOW)
         
     def demonstrate_error_handling(self):
         """Demonstrate error handling and recovery"""
-        self.print_section("Error Handling & Recovery")
-        
-        print("Flow provides robust error handling for failed operations.")
-        print("Supports retry policies, fallback strategies, and graceful degradation.")
-        print()
-        
-        print(f"{Colors.BOLD}Scenario: Network Operation with Fallback{Colors.ENDC}")
-        
-        # Simulate network error and recovery
-        self.print_step("Attempting to fetch player statistics...")
-        time.sleep(0.1)
-        
-        self.print_error("Network timeout - primary server unreachable")
-        time.sleep(0.1)
-        
-        self.print_step("Error handler triggered - trying fallback server...")
-        time.sleep(0.1)
-        
-        self.print_warning("Fallback server slow - using cached data")
-        time.sleep(0.1)
+        self._run_script(ERROR_HANDLING)
         
-        self.print_success("✓ Graceful fallback completed")
-        self.print_step("  └ Using cached stats (5 minutes old)")
-        print()
-        
-        print(f"{Colors.BOLD}Scenario: Retry Policy{Colors.ENDC}")
-        
-        for attempt in range(1, 4):
-            self.print_step(f"Connection attempt #{attempt}")
-            time.sleep(0.1)
-            
-            if attempt < 3:
-                self.print_error(f"Attempt {attempt} failed - retrying in 2s...")
-                time.sleep(0.1)
-            else:
-                self.print_success("✓ Connection successful!")
-                self.print_step("  └ Retry policy succeeded on attempt 3")
-                
     def check_prerequisites(self) -> bool:
         """Check if Flow library is built and available"""
-        flow_dll = self.bin_dir / "Flow.dll"
-        test_dll = self.bin_dir / "TestFlow.dll"
-        
-        if not flow_dll.exists():
+        try:
+            with os.scandir(self.bin_dir) as it:
+                names = {entry.name for entry in it}
+        except FileNotFoundError:
+            names = set()
+            
+        if "Flow.dll" not in names:
             self.print_warning("Flow.dll not found in Bin/Release/")
             self.print_warning("Running in SIMULATION MODE - demonstrating concepts without compiled binaries")
             print()
@@ -462,7 +437,7 @@ class FlowDemo:
             self.print_step("Continuing with conceptual demonstration...")
             return True
             
-        if not test_dll.exists():
+        if "TestFlow.dll" not in names:
             self.print_warning("TestFlow.dll not found - some demos may be limited")
             
         self.print_success("✓ Flow.dll found - running with actual compiled library")
@@ -474,13 +449,13 @@ class FlowDemo:
         
         print("CsharpFlow uses a hierarchical architecture:")
         print()
-        print(f"{Colors.BOLD}Core Components:{Colors.ENDC}")
+        print(f"{BOLD}Core Components:{ENDC}")
         print("├── Kernel - Central execution engine")
         print("├── Factory - Object creation and configuration") 
         print("├── Generator - Base class for all executable units")
         print("└── Transient - Lifetime management")
         print()
-        print(f"{Colors.BOLD}Flow Control Primitives:{Colors.ENDC}")
+        print(f"{BOLD}Flow Control Primitives:{ENDC}")
         print("├── Coroutines - Suspendable functions")
         print("├── Sequences - Ordered execution")
         print("├── Barriers - Wait for all (AND logic)")
@@ -488,7 +463,7 @@ class FlowDemo:
         print("├── Futures - Asynchronous values")
         print("└── Timers - Time-based execution")
         print()
-        print(f"{Colors.BOLD}Advanced Features:{Colors.ENDC}")
+        print(f"{BOLD}Advanced Features:{ENDC}")
         print("├── Nested workflows - Complex compositions")
         print("├── Event system - Completion notifications")
         print("├── Error handling - Graceful failure recovery")
@@ -503,8 +478,8 @@ class FlowDemo:
         print(f"This interactive demo will showcase all major features")
         print(f"of the Flow coroutine system in action.")
         print()
-        print(f"Demo started at: {Colors.BOLD}{self.start_time.strftime('%H:%M:%S')}{Colors.ENDC}")
-        print(f"Estimated duration: {Colors.BOLD}45 seconds{Colors.ENDC}")
+        print(f"Demo started at: {BOLD}{self.start_time.strftime('%H:%M:%S')}{ENDC}")
+        print(f"Estimated duration: {BOLD}45 seconds{ENDC}")
         print()
         
         self.check_prerequisites()
@@ -526,8 +501,9 @@ class FlowDemo:
         ]
         
         for i, (name, demo_func) in enumerate(demos, 1):
-            print(f"\n{Colors.HEADER}Demo {i}/{len(demos)}{Colors.ENDC}")
-            demo_func()
+            with batched_out(self.batch_output):
+                print(f"\n{HEADER}Demo {i}/{len(demos)}{ENDC}")
+                demo_func()
             
             if i < len(demos):
                 self.wait_for_user(f"\nDemo {i} complete. Continue to next demo?")
@@ -535,10 +511,10 @@ class FlowDemo:
         # Demo complete
         self.print_header("🎉 Demo Complete!")
         
-        total_time = datetime.now() - self.start_time
-        print(f"Total demo time: {Colors.BOLD}{total_time.total_seconds():.1f} seconds{Colors.ENDC}")
+        total_time = time.monotonic() - self._t0
+        print(f"Total demo time: {BOLD}{total_time:.1f} seconds{ENDC}")
         print()
-        print(f"{Colors.OKGREEN}Congratulations!{Colors.ENDC} You've seen all major CsharpFlow features:")
+        print(f"{OKGREEN}Congratulations!{ENDC} You've seen all major CsharpFlow features:")
         print("✓ Kernel execution and stepping")
         print("✓ Coroutines and generators") 
         print("✓ Synchronization primitives (Barriers, Triggers)")
@@ -548,13 +524,13 @@ class FlowDemo:
         print("✓ Complex nested scenarios")
         print("✓ Error handling and recovery")
         print()
-        print(f"{Colors.BOLD}Next Steps:{Colors.ENDC}")
+        print(f"{BOLD}Next Steps:{ENDC}")
         print("• Explore the source code in Interfaces/ and Impl/")
         print("• Run the test suite: python3 run_tests.py")
         print("• Check out the documentation in *.md files")
         print("• Try building your own coroutines!")
         print()
-        print(f"{Colors.OKCYAN}Happy coding with CsharpFlow! 🌊{Colors.ENDC}")
+        print(f"{OKCYAN}Happy coding with CsharpFlow! 🌊{ENDC}")
         
         return 0
 
@@ -573,6 +549,7 @@ def main():
         print("• Build the project first: python3 build.py")
         print("• Run in a terminal with ANSI color support")
         print("• Allow 5-8 minutes for the full demonstration")
+        print("• Set DEMO_SPEED (e.g. DEMO_SPEED=1000) to play back faster")
         return 0
         
     demo = FlowDemo()
@@ -10,126 +10,114 @@ import os
 import sys
 import time
 from pathlib import Path
-from datetime import datetime
 
-class Colors:
-    """ANSI color codes"""
-    HEADER = '\033[95m'
-    OKBLUE = '\033[94m'
-    OKCYAN = '\033[96m'
-    OKGREEN = '\033[92m'
-    WARNING = '\033[93m'
-    FAIL = '\033[91m'
-    ENDC = '\033[0m'
-    BOLD = '\033[1m'
+from _demo_colors import *
+
+# (seconds from start, kind, text) for every line of the timed demo
+SCRIPT = [
+    (0.0, 'header', "🚀 CsharpFlow - 45 Second Demo"),
+    (0.0, 'text', "Fast overview of C# coroutine library features..."),
+    
+    # Kernel (3s)
+    (0.5, 'step', "🔧 Kernel: Central execution engine managing coroutines"),
+    (0.8, 'step', "   kernel.Step() processes all active generators"),
+    
+    # Coroutines (4s)
+    (1.5, 'step', "⚡ Coroutines: Suspendable functions with yield return"),
+    (1.8, 'step', "   PlayerMovement, AI, Animation running in parallel"),
+    (2.5, 'success', "Multiple coroutines executing concurrently"),
+    
+    # Barriers (5s)
+    (3.0, 'step', "🚧 Barriers: Wait for ALL tasks to complete"),
+    (3.3, 'step', "   Loading assets, connecting server, init graphics..."),
+    (4.1, 'success', "All initialization complete - game can start!"),
+    
+    # Triggers (4s)
+    (4.5, 'step', "⚡ Triggers: Wait for ANY task to complete"),
+    (4.8, 'step', "   Player input OR 5-second timeout..."),
+    (5.6, 'success', "Timeout reached - proceeding with default action"),
+    
+    # Futures (4s)
+    (5.9, 'step', "🔮 Futures: Asynchronous value resolution"),
+    (6.2, 'step', "   HTTP request to api.example.com/user/data..."),
+    (7.0, 'success', "Future resolved - coroutine resumed with user data"),
+    
+    # Timers (4s)
+    (7.3, 'step', "⏰ Timers: Time-based execution"),
+    (7.6, 'step', "   PeriodicTimer(2s) - heartbeat every 2 seconds"),
+    (8.4, 'success', "342 users online - system monitoring active"),
+    
+    # Sequences (4s)
+    (8.7, 'step', "📋 Sequences: Ordered step-by-step execution"),
+    (9.0, 'step', "   Draw Cards → Player Action → Combat → Cleanup"),
+    (9.8, 'success', "Game turn sequence completed successfully"),
+    
+    # Complex Workflow (6s)
+    (10.1, 'step', "🎮 Complex Example: Multiplayer battle turn"),
+    (10.3, 'step', "   Barrier(init) → Trigger(input) → Future(damage)"),
+    (10.7, 'step', "   → Sequence(animations) → Barrier(cleanup)"),
+    (11.3, 'success', "Complex nested workflow completed!"),
+    
+    # Error Handling (3s)
+    (11.6, 'step', "🛡️  Error Handling: Graceful failure recovery"),
+    (12.0, 'step', "   Network timeout → fallback server → cached data"),
+    (12.6, 'success', "Resilient systems with automatic recovery"),
+    
+    # Summary (5s)
+    (13.1, 'header', "🎉 Demo Complete!"),
+]
 
 class FastDemo:
     def __init__(self):
-        self.start_time = datetime.now()
+        self._t0 = time.monotonic()
         
     def print_header(self, text: str):
-        print(f"\n{Colors.HEADER}{Colors.BOLD}{text}{Colors.ENDC}")
+        print(f"\n{HEADER}{BOLD}{text}{ENDC}")
         
     def print_step(self, text: str):
-        elapsed = (datetime.now() - self.start_time).total_seconds()
-        print(f"{Colors.OKCYAN}[{elapsed:04.1f}s]{Colors.ENDC} {text}")
+        elapsed = time.monotonic() - self._t0
+        emit(STEP_OPEN_B, f"{elapsed:04.1f}s{STEP_CLOSE}{text}")
         
     def print_success(self, text: str):
-        print(f"{Colors.OKGREEN}✓{Colors.ENDC} {text}")
+        emit(SUCCESS_MARK_B, text)
         
     def fast_demo(self):
         """Complete demo in 45 seconds"""
-        self.print_header("🚀 CsharpFlow - 45 Second Demo")
-        print("Fast overview of C# coroutine library features...")
-        time.sleep(0.5)
-        
-        # Kernel (3s)
-        self.print_step("🔧 Kernel: Central execution engine managing coroutines")
-        time.sleep(0.3)
-        self.print_step("   kernel.Step() processes all active generators")
-        time.sleep(0.7)
-        
-        # Coroutines (4s)  
-        self.print_step("⚡ Coroutines: Suspendable functions with yield return")
-        time.sleep(0.3)
-        self.print_step("   PlayerMovement, AI, Animation running in parallel")
-        time.sleep(0.7)
-        self.print_success("Multiple coroutines executing concurrently")
-        time.sleep(0.5)
-        
-        # Barriers (5s)
-        self.print_step("🚧 Barriers: Wait for ALL tasks to complete")
-        time.sleep(0.3)
-        self.print_step("   Loading assets, connecting server, init graphics...")
-        time.sleep(0.8)
-        self.print_success("All initialization complete - game can start!")
-        time.sleep(0.4)
-        
-        # Triggers (4s)
-        self.print_step("⚡ Triggers: Wait for ANY task to complete")
-        time.sleep(0.3)
-        self.print_step("   Player input OR 5-second timeout...")
-        time.sleep(0.8)
-        self.print_success("Timeout reached - proceeding with default action")
-        time.sleep(0.3)
-        
-        # Futures (4s)
-        self.print_step("🔮 Futures: Asynchronous value resolution")
-        time.sleep(0.3)
-        self.print_step("   HTTP request to api.example.com/user/data...")
-        time.sleep(0.8)
-        self.print_success("Future resolved - coroutine resumed with user data")
-        time.sleep(0.3)
+        now = time.monotonic
+        sleep = demo_sleep
+        speed = DEMO_SPEED
+        start = now()
+        dispatch = {
+            'header': self.print_header,
+            'text': print,
+            'step': self.print_step,
+            'success': self.print_success,
+        }
+        
+        # Sleep until each entry's deadline rather than for fixed delays,
+        # so scheduler wake-up latency does not accumulate over the demo
+        for offset, kind, text in SCRIPT:
+            sleep(offset - (now() - start) * speed)
+            dispatch[kind](text)
+        
+        # The summary has no pacing, so emit it with a single write
+        with batched_out():
+            self.print_summary()
         
-        # Timers (4s)
-        self.print_step("⏰ Timers: Time-based execution")
-        time.sleep(0.3)
-        self.print_step("   PeriodicTimer(2s) - heartbeat every 2 seconds")
-        time.sleep(0.8)
-        self.print_success("342 users online - system monitoring active")
-        time.sleep(0.3)
-        
-        # Sequences (4s)
-        self.print_step("📋 Sequences: Ordered step-by-step execution")
-        time.sleep(0.3)
-        self.print_step("   Draw Cards → Player Action → Combat → Cleanup")
-        time.sleep(0.8)
-        self.print_success("Game turn sequence completed successfully")
-        time.sleep(0.3)
-        
-        # Complex Workflow (6s)
-        self.print_step("🎮 Complex Example: Multiplayer battle turn")
-        time.sleep(0.2)
-        self.print_step("   Barrier(init) → Trigger(input) → Future(damage)")
-        time.sleep(0.4)
-        self.print_step("   → Sequence(animations) → Barrier(cleanup)")
-        time.sleep(0.6)
-        self.print_success("Complex nested workflow completed!")
-        time.sleep(0.3)
-        
-        # Error Handling (3s)
-        self.print_step("🛡️  Error Handling: Graceful failure recovery")
-        time.sleep(0.4)
-        self.print_step("   Network timeout → fallback server → cached data")
-        time.sleep(0.6)
-        self.print_success("Resilient systems with automatic recovery")
-        time.sleep(0.5)
+        return 0
         
-        # Summary (5s)
-        self.print_header("🎉 Demo Complete!")
-        elapsed = (datetime.now() - self.start_time).total_seconds()
-        print(f"Total time: {Colors.BOLD}{elapsed:.1f} seconds{Colors.ENDC}")
+    def print_summary(self):
+        elapsed = time.monotonic() - self._t0
+        print(f"Total time: {BOLD}{elapsed:.1f} seconds{ENDC}")
         print()
-        print(f"{Colors.OKGREEN}CsharpFlow Features Demonstrated:{Colors.ENDC}")
+        print(f"{OKGREEN}CsharpFlow Features Demonstrated:{ENDC}")
         print("✓ Kernel execution engine    ✓ Async Futures")  
         print("✓ Coroutines & Generators    ✓ Time-based Timers")
         print("✓ Barriers (wait for all)    ✓ Ordered Sequences") 
         print("✓ Triggers (wait for any)    ✓ Error handling")
         print()
-        print(f"{Colors.BOLD}Perfect for:{Colors.ENDC} Game loops, async workflows, state machines")
-        print(f"{Colors.BOLD}Get started:{Colors.ENDC} python3 build.py && python3 run_tests.py")
-        
-        return 0
+        print(f"{BOLD}Perfect for:{ENDC} Game loops, async workflows, state machines")
+        print(f"{BOLD}Get started:{ENDC} python3 build.py && python3 run_tests.py")
 
 def main():
     if len(sys.argv) > 1 and sys.argv[1] in ['-h', '--help']:
@@ -139,6 +127,7 @@ def main():
         print()
         print("Quick demonstration of all major CsharpFlow features")
         print("in under 45 seconds. No interaction required.")
+        print("Set DEMO_SPEED (e.g. DEMO_SPEED=10) to play back faster.")
         print()
         print("For the full interactive demo: python3 demo.py")
         return 0
@@ -9,17 +9,196 @@ with support for multiple build environments and detailed reporting.
 """
 
 import os
+import re
 import sys
+import signal
 import subprocess
 import shutil
 import json
+import mmap
 import time
+import threading
+import hashlib
+import asyncio
 import platform
+import xml.etree.ElementTree as ET
+import functools
+import multiprocessing
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from dataclasses import dataclass
-from typing import List, Dict, Optional, Tuple
+from dataclasses import dataclass, asdict, is_dataclass
+from typing import List, Dict, Optional, Tuple, Iterator
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Build output and VCS folders never hold project sources
+_SKIP_DIRS = {"bin", "obj", ".git", "Bin"}
+
+# Run summaries from dotnet test (vstest) and the NUnit console runners
+_PASS_RE = re.compile(r"(?:Passed!|Test Run Successful|Overall result: Passed)")
+_FAIL_RE = re.compile(r"(?:Failed!\s*-\s*Failed:\s*(\d+)|Errors:\s*(\d+))")
+
+# [Test] attributes plus namespace and class declarations (which may
+# follow a UTF-8 BOM), found in one pass over a file's raw bytes; the
+# declarations are used to shard and match tests by the fixture classes
+# a file declares rather than by its file name
+_TEST_SCAN_RE = re.compile(
+    rb"(\[Test\])"
+    rb"|^(?:\xef\xbb\xbf)?[ \t]*namespace\s+([\w.]+)"
+    rb"|^(?:\xef\xbb\xbf)?[ \t]*(?:(?:public|internal|sealed|abstract|static|partial)\s+)*class\s+(\w+)",
+    re.M
+)
+
+# Project paths in a .sln, and package entries in a packages.config
+_SLN_PROJECT_RE = re.compile(r'"([^"]+\.csproj)"')
+_PACKAGE_RE = re.compile(rb'<package\s+id="([^"]+)"\s+version="([^"]+)"')
+
+# How long a cached tool probe stays valid
+_TOOL_CACHE_TTL = 24 * 60 * 60
+
+# Below this many test files a process pool costs more than it saves
+_POOL_MIN_FILES = 64
+
+# Seconds a child gets to exit after SIGTERM before it is killed
+_TERM_GRACE = 5.0
+
+# Files smaller than this are cheaper to read() than to map
+_MMAP_MIN_SIZE = 4096
+
+def _scan_matches(matches: Iterator[re.Match]) -> Tuple[int, List[str]]:
+    """Fold _TEST_SCAN_RE matches into a [Test] count and qualified class names"""
+    count = 0
+    namespace = None
+    classes = []
+    for match in matches:
+        test, ns, cls = match.groups()
+        if test:
+            count += 1
+        elif ns:
+            namespace = namespace or ns.decode("ascii")
+        else:
+            classes.append(cls.decode("ascii"))
+    prefix = namespace + "." if namespace else ""
+    return count, [prefix + name for name in classes]
+
+def _scan_test_file(path: str) -> Tuple[int, List[str]]:
+    """Count [Test] attributes and find declared classes, scanning raw bytes once"""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_MIN_SIZE:
+            return _scan_matches(_TEST_SCAN_RE.finditer(f.read()))
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _scan_matches(_TEST_SCAN_RE.finditer(mm))
+
+def _scan(path: str) -> Tuple[str, Tuple[int, List[str]]]:
+    """Scan one test file (module level so Pool can pickle it)"""
+    try:
+        return path, _scan_test_file(path)
+    except OSError:
+        return path, (0, [])
+
+# Child processes are started through _spawned, except the build steps,
+# which _run_logged starts through asyncio. Both pass start_new_session and
+# neither passes preexec_fn or shell=True, so CPython takes its vfork() path
+# rather than fork()ing this interpreter's address space (start_new_session
+# rules out posix_spawn, but setsid() runs in the C child code and does not
+# force a full fork). Each child leads its own process group, so a timeout
+# can SIGTERM and then SIGKILL it together with any processes it started.
+# Being outside the terminal's process group, children never see Ctrl+C
+# themselves; _spawned children are tracked in _children so an interrupted
+# run can stop them, and _run_logged stops its own child when cancelled.
+_children = set()
+_interrupted = threading.Event()
+
+def _stop(proc, force: bool):
+    """Signal a child's whole process group (just the child on Windows)"""
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(proc.pid, signal.SIGKILL if force else signal.SIGTERM)
+        elif force:
+            proc.kill()
+        else:
+            proc.terminate()
+    except ProcessLookupError:
+        pass
+
+@contextmanager
+def _spawned(cmd: List[str], **kwargs) -> Iterator[subprocess.Popen]:
+    """Popen in a new session; escalate SIGTERM to SIGKILL if it outlives the block"""
+    if _interrupted.is_set():
+        raise InterruptedError("test run interrupted")
+    proc = subprocess.Popen(cmd, start_new_session=True, **kwargs)
+    _children.add(proc)
+    try:
+        yield proc
+    finally:
+        _children.discard(proc)
+        if proc.poll() is None:
+            _stop(proc, force=False)
+            try:
+                proc.wait(timeout=_TERM_GRACE)
+            except subprocess.TimeoutExpired:
+                _stop(proc, force=True)
+                proc.wait()
+        for stream in (proc.stdin, proc.stdout, proc.stderr):
+            if stream:
+                stream.close()
+
+def _stop_all():
+    """Stop every running _spawned child's process group and refuse new ones"""
+    _interrupted.set()
+    procs = list(_children)
+    for proc in procs:
+        _stop(proc, force=False)
+    deadline = time.monotonic() + _TERM_GRACE
+    for proc in procs:
+        try:
+            proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            _stop(proc, force=True)
+
+def _run_process(cmd: List[str], timeout: Optional[float] = None, **kwargs) -> subprocess.CompletedProcess:
+    """Run a command to completion, capturing text output, within a timeout"""
+    with _spawned(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, **kwargs) as proc:
+        stdout, stderr = proc.communicate(timeout=timeout)
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+
+@functools.cache
+def _which(name: str) -> Optional[str]:
+    """shutil.which, looked up once per tool for the life of the process"""
+    return shutil.which(name)
+
+@functools.cache
+def _probe_tool(name: str, args: Tuple[str, ...]) -> subprocess.CompletedProcess:
+    """Run a tool probe such as `dotnet --version` once per process"""
+    return _run_process([name, *args], timeout=10)
+
+def _json_default(obj):
+    """Encode report dataclasses and enums for the stdlib json fallback"""
+    if isinstance(obj, Enum):
+        return obj.value
+    if is_dataclass(obj):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _dumps(data) -> bytes:
+    """Serialize a report to indented JSON bytes, with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, default=_json_default).encode()
+
+def _trx_seconds(value: Optional[str]) -> float:
+    """Convert a TRX hh:mm:ss.fffffff duration to seconds"""
+    if not value:
+        return 0.0
+    hours, minutes, seconds = value.split(":")
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
 class BuildTool(Enum):
     DOTNET = "dotnet"
     MONO = "mono"
@@ -30,7 +209,10 @@ class TestResult(Enum):
     FAIL = "FAIL"
     SKIP = "SKIP"
 
-@dataclass
+# Slotted dataclasses need Python 3.10; older interpreters get plain ones
+_slotted_dataclass = functools.partial(dataclass, slots=True) if sys.version_info >= (3, 10) else dataclass
+
+@_slotted_dataclass
 class TestSuite:
     name: str
     file_path: str
@@ -39,7 +221,7 @@ class TestSuite:
     duration: float = 0.0
     details: str = ""
 
-@dataclass
+@_slotted_dataclass
 class BuildReport:
     success: bool
     build_tool: BuildTool
@@ -55,6 +237,9 @@ class CsharpFlowTester:
         self.test_project = self.project_root / "TestFlow" / "TestFlow.csproj"
         self.build_tool = BuildTool.NONE
         self.test_suites: List[TestSuite] = []
+        self.tool_cache_file = self.bin_folder / ".tool_cache.json"
+        self._totals: Optional[Dict[str, int]] = None
+        self._suite_classes: Dict[str, List[str]] = {}
         
     def print_header(self):
         """Print colorful header with system info"""
@@ -71,27 +256,40 @@ class CsharpFlowTester:
         """Check available build tools and return the best option"""
         print("📋 Checking build tools...")
         
+        # Reuse the last probe while PATH is unchanged; `dotnet --version`
+        # alone can take most of a second on a cold .NET host
+        path_key = hashlib.sha256(os.environ.get("PATH", "").encode()).hexdigest()[:16]
+        cached = self._load_tool_cache(path_key)
+        if cached:
+            tool, version = cached
+            print(f"✅ {tool.value} found: {version} (cached)")
+            self.build_tool = tool
+            return tool
+        
         tools_to_check = [
-            ("dotnet", BuildTool.DOTNET, "dotnet --version"),
-            ("mono", BuildTool.MONO, "mono --version"),
+            ("dotnet", BuildTool.DOTNET, ("--version",)),
+            ("mono", BuildTool.MONO, ("--version",)),
         ]
         
-        for tool, enum_val, version_cmd in tools_to_check:
-            if shutil.which(tool):
+        # Probe every installed tool at once, then pick by preference order
+        # without waiting for less preferred probes still in flight
+        available = [(tool, enum_val, args) for tool, enum_val, args in tools_to_check if _which(tool)]
+        pool = ThreadPoolExecutor(max_workers=max(1, len(available)))
+        futures = [pool.submit(_probe_tool, tool, args) for tool, _, args in available]
+        try:
+            for (tool, enum_val, _), future in zip(available, futures):
                 try:
-                    result = subprocess.run(
-                        version_cmd.split(), 
-                        capture_output=True, 
-                        text=True, 
-                        timeout=10
-                    )
+                    result = future.result()
                     if result.returncode == 0:
                         version = result.stdout.strip().split('\n')[0]
                         print(f"✅ {tool} found: {version}")
                         self.build_tool = enum_val
+                        self._save_tool_cache(path_key, enum_val, version)
                         return enum_val
                 except (subprocess.TimeoutExpired, subprocess.SubprocessError):
                     print(f"⚠️  {tool} found but not responding")
+        finally:
+            pool.shutdown(wait=False)
                     
         print("❌ No suitable build tools found")
         print("📥 Install options:")
@@ -99,6 +297,27 @@ class CsharpFlowTester:
         print("   • Mono: sudo apt install mono-devel mono-complete")
         return BuildTool.NONE
 
+    def _load_tool_cache(self, path_key: str) -> Optional[Tuple[BuildTool, str]]:
+        """Return the cached (tool, version) if it was probed recently with this PATH"""
+        try:
+            cache = json.loads(self.tool_cache_file.read_text())
+            if cache["path"] != path_key or cache["mtime"] <= time.time() - _TOOL_CACHE_TTL:
+                return None
+            return BuildTool[cache["tool"]], cache["version"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _save_tool_cache(self, path_key: str, tool: BuildTool, version: str):
+        """Persist a successful tool probe, replacing the cache file atomically"""
+        cache = {"path": path_key, "tool": tool.name, "version": version, "mtime": time.time()}
+        tmp = self.tool_cache_file.with_name(self.tool_cache_file.name + ".tmp")
+        try:
+            self.bin_folder.mkdir(exist_ok=True)
+            tmp.write_text(json.dumps(cache))
+            os.replace(tmp, self.tool_cache_file)
+        except OSError:
+            pass
+
     def create_bin_folder(self):
         """Create Bin folder for output binaries"""
         print(f"📁 Creating Bin folder: {self.bin_folder}")
@@ -109,44 +328,109 @@ class CsharpFlowTester:
         (self.bin_folder / "Release").mkdir(exist_ok=True)
         print("✅ Bin folder structure created")
 
-    def analyze_project_structure(self):
+    async def analyze_project_structure(self):
         """Analyze project structure and identify test suites"""
-        print("📊 Analyzing project structure...")
-        
-        # Count source files
-        cs_files = list(self.project_root.rglob("*.cs"))
-        interface_files = list((self.project_root / "Interfaces").glob("*.cs"))
-        impl_files = list((self.project_root / "Impl").glob("*.cs"))
-        test_files = list((self.project_root / "TestFlow" / "Editor").glob("Test*.cs"))
+        # The scan runs on a worker thread so it overlaps the build's
+        # subprocesses; the report is printed as one block when it is done
+        cs_files, interface_files, impl_files, test_files = await asyncio.to_thread(self._classify_sources)
+        test_paths = [path for _, path in test_files]
+        scans = await asyncio.to_thread(self._scan_all_test_files, test_paths)
         
-        print(f"📄 Total C# files: {len(cs_files)}")
-        print(f"🔌 Interface files: {len(interface_files)}")
-        print(f"⚙️  Implementation files: {len(impl_files)}")
-        print(f"🧪 Test files: {len(test_files)}")
+        lines = [
+            "📊 Analyzing project structure...",
+            f"📄 Total C# files: {len(cs_files)}",
+            f"🔌 Interface files: {len(interface_files)}",
+            f"⚙️  Implementation files: {len(impl_files)}",
+            f"🧪 Test files: {len(test_files)}",
+        ]
         
         # Analyze test files
-        for test_file in test_files:
-            test_count = self.count_test_methods(test_file)
+        for name, path in test_files:
+            test_count, classes = scans.get(path, (0, []))
+            suite_name = name[:-len(".cs")]
             self.test_suites.append(TestSuite(
-                name=test_file.stem,
-                file_path=str(test_file),
+                name=suite_name,
+                file_path=path,
                 test_count=test_count
             ))
-            print(f"   • {test_file.name}: {test_count} tests")
+            self._suite_classes[suite_name] = classes or [suite_name]
+            lines.append(f"   • {name}: {test_count} tests")
         
         total_tests = sum(suite.test_count for suite in self.test_suites)
-        print(f"🎯 Total test methods: {total_tests}")
-        print()
+        lines.append(f"🎯 Total test methods: {total_tests}")
+        print("\n".join(lines) + "\n")
+
+    def _classify_sources(self) -> Tuple[List[str], List[str], List[str], List[Tuple[str, str]]]:
+        """Walk the tree once, bucketing C# file paths into all/interface/impl/test"""
+        root_dir = str(self.project_root)
+        interfaces_dir = os.path.join(root_dir, "Interfaces")
+        impl_dir = os.path.join(root_dir, "Impl")
+        tests_dir = os.path.join(root_dir, "TestFlow", "Editor")
+        
+        # Paths stay as the str DirEntry already holds rather than one Path
+        # per file; test files are (file name, path) pairs
+        cs_all, interface_files, impl_files, test_files = [], [], [], []
+        pending = [root_dir]
+        while pending:
+            directory = pending.pop()
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if name not in _SKIP_DIRS:
+                        pending.append(entry.path)
+                    continue
+                if not name.endswith(".cs"):
+                    continue
+                cs_all.append(entry.path)
+                if directory == interfaces_dir:
+                    interface_files.append(entry.path)
+                elif directory == impl_dir:
+                    impl_files.append(entry.path)
+                elif directory == tests_dir and name.startswith("Test"):
+                    test_files.append((name, entry.path))
+        
+        return cs_all, interface_files, impl_files, test_files
 
-    def count_test_methods(self, file_path: Path) -> int:
+    def _scan_all_test_files(self, paths: List[str]) -> Dict[str, Tuple[int, List[str]]]:
+        """Count [Test] methods and find declared classes in all test files in one pass"""
+        if not paths:
+            return {}
+        
+        # ripgrep scans every file in a single process with the same
+        # pattern; it omits files with no matches and exits with 1 when
+        # nothing matched at all
+        rg = _which("rg")
+        if rg:
+            result = _run_process(
+                [rg, "--only-matching", "--with-filename", "--null", "--no-line-number",
+                 "--no-messages", "-e", _TEST_SCAN_RE.pattern.decode(), "--", *paths]
+            )
+            if result.returncode in (0, 1):
+                matches = defaultdict(list)
+                for line in result.stdout.splitlines():
+                    path, _, text = line.partition("\0")
+                    match = _TEST_SCAN_RE.match(text.encode())
+                    if match:
+                        matches[path].append(match)
+                return {path: _scan_matches(matches[path]) for path in paths}
+        
+        if len(paths) < _POOL_MIN_FILES:
+            return dict(map(_scan, paths))
+        with multiprocessing.Pool(min(os.cpu_count() or 1, len(paths))) as pool:
+            return dict(pool.map(_scan, paths))
+
+    def count_test_methods(self, path: str) -> int:
         """Count [Test] methods in a test file"""
         try:
-            content = file_path.read_text(encoding='utf-8')
-            return content.count('[Test]')
+            return _scan_test_file(path)[0]
         except Exception:
             return 0
 
-    def build_project(self) -> BuildReport:
+    async def build_project(self) -> BuildReport:
         """Build the project using available build tools"""
         print("🔨 Building CsharpFlow...")
         start_time = time.time()
@@ -161,9 +445,9 @@ class CsharpFlowTester:
         
         try:
             if self.build_tool == BuildTool.DOTNET:
-                return self.build_with_dotnet(start_time)
+                return await self.build_with_dotnet(start_time)
             elif self.build_tool == BuildTool.MONO:
-                return self.build_with_mono(start_time)
+                return await self.build_with_mono(start_time)
         except Exception as e:
             return BuildReport(
                 success=False,
@@ -172,39 +456,127 @@ class CsharpFlowTester:
                 output=f"Build failed with exception: {str(e)}"
             )
 
-    def build_with_dotnet(self, start_time: float) -> BuildReport:
+    async def _run_logged(self, cmd: List[str], desc: str, log, timeout: float) -> int:
+        """Run a build command with its output going straight to the build log"""
+        log.write(f"=== {desc} ===\n")
+        log.flush()
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=log,
+            stderr=asyncio.subprocess.STDOUT,
+            cwd=self.project_root,
+            start_new_session=True
+        )
+        try:
+            return await asyncio.wait_for(proc.wait(), timeout)
+        except asyncio.TimeoutError:
+            await self._stop_logged(proc)
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        except asyncio.CancelledError:
+            await self._stop_logged(proc)
+            raise
+        except KeyboardInterrupt:
+            # The loop is going down, so there is no waiting out the grace period
+            _stop(proc, force=True)
+            raise
+
+    async def _stop_logged(self, proc):
+        """Stop a build step's process group, taking down MSBuild worker nodes and compiler servers too"""
+        _stop(proc, force=False)
+        try:
+            await asyncio.wait_for(proc.wait(), _TERM_GRACE)
+        except asyncio.TimeoutError:
+            _stop(proc, force=True)
+            await proc.wait()
+
+    def _restore_digest(self) -> Optional[str]:
+        """Digest of every restore input, or None if a restored package is missing
+        
+        The inputs are the solution's projects, their packages.config files
+        and NuGet.Config; packages.config packages must be unpacked under
+        packages/ and PackageReference projects must have project.assets.json.
+        """
+        try:
+            solution = self.solution_file.read_text(encoding="utf-8-sig", errors="replace")
+        except OSError:
+            return None
+        
+        inputs = [self.project_root / "NuGet.Config", self.project_root / ".nuget" / "NuGet.Config"]
+        for rel in _SLN_PROJECT_RE.findall(solution):
+            project = self.project_root / rel.replace("\\", "/")
+            inputs += [project, project.parent / "packages.config"]
+        
+        hasher = hashlib.blake2b()
+        for path in inputs:
+            try:
+                data = path.read_bytes()
+            except FileNotFoundError:
+                continue
+            except OSError:
+                return None
+            if path.name == "packages.config":
+                for package_id, version in _PACKAGE_RE.findall(data):
+                    if not (self.project_root / "packages" / f"{package_id.decode()}.{version.decode()}").is_dir():
+                        return None
+            elif path.suffix == ".csproj" and b"<PackageReference" in data:
+                if not (path.parent / "obj" / "project.assets.json").exists():
+                    return None
+            hasher.update(str(path.relative_to(self.project_root)).encode() + b"\0")
+            hasher.update(data)
+        return hasher.hexdigest()
+
+    async def build_with_dotnet(self, start_time: float) -> BuildReport:
         """Build using .NET CLI"""
         print("Using .NET CLI...")
         
         # Set output path to our Bin folder
         output_path = self.bin_folder / "Debug"
+        log_path = self.bin_folder / "build.log"
+        
+        # Restore only when a restore input changed since the last successful
+        # restore, or a package it produced has gone missing
+        restore_stamp = self.bin_folder / ".restore_stamp"
+        digest = self._restore_digest()
+        try:
+            fresh = digest is not None and restore_stamp.read_text() == digest
+        except OSError:
+            fresh = False
+        
+        commands = []
+        if fresh:
+            print("♻️  Restore skipped (cache fresh)")
+        else:
+            commands.append((["dotnet", "restore", str(self.solution_file)], "Restoring packages"))
         
-        commands = [
-            (["dotnet", "restore", str(self.solution_file)], "Restoring packages"),
+        # TestFlow references Flow, so the projects build as one solution
+        # rather than concurrently, which would race on Flow's obj folder
+        commands += [
             (["dotnet", "build", str(self.solution_file), 
+              "--no-restore",
               "--configuration", "Debug", 
               "--output", str(output_path)], "Building solution")
         ]
         
-        all_output = []
-        for cmd, desc in commands:
-            print(f"   {desc}...")
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=self.project_root,
-                timeout=300
+        success = True
+        with open(log_path, "w") as log:
+            for cmd, desc in commands:
+                print(f"   {desc}...")
+                if await self._run_logged(cmd, desc, log, 300) != 0:
+                    success = False
+                    break
+                if cmd[1] == "restore":
+                    digest = self._restore_digest()
+                    if digest is not None:
+                        restore_stamp.write_text(digest)
+        
+        output = log_path.read_text(errors="replace")
+        if not success:
+            return BuildReport(
+                success=False,
+                build_tool=BuildTool.DOTNET,
+                duration=time.time() - start_time,
+                output=output
             )
-            all_output.append(f"=== {desc} ===\n{result.stdout}\n{result.stderr}\n")
-            
-            if result.returncode != 0:
-                return BuildReport(
-                    success=False,
-                    build_tool=BuildTool.DOTNET,
-                    duration=time.time() - start_time,
-                    output="\n".join(all_output)
-                )
         
         # Find the built DLL
         dll_path = output_path / "Flow.dll"
@@ -213,19 +585,20 @@ class CsharpFlowTester:
             success=True,
             build_tool=BuildTool.DOTNET,
             duration=time.time() - start_time,
-            output="\n".join(all_output),
+            output=output,
             binary_path=str(dll_path) if dll_path.exists() else None
         )
 
-    def build_with_mono(self, start_time: float) -> BuildReport:
+    async def build_with_mono(self, start_time: float) -> BuildReport:
         """Build using Mono/MSBuild"""
         print("Using Mono/MSBuild...")
         
         # Try different MSBuild commands
         msbuild_commands = ["msbuild", "xbuild"]
+        log_path = self.bin_folder / "build.log"
         
         for msbuild_cmd in msbuild_commands:
-            if shutil.which(msbuild_cmd):
+            if _which(msbuild_cmd):
                 cmd = [
                     msbuild_cmd,
                     str(self.solution_file),
@@ -234,17 +607,12 @@ class CsharpFlowTester:
                 ]
                 
                 print(f"   Using {msbuild_cmd}...")
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    cwd=self.project_root,
-                    timeout=300
-                )
+                with open(log_path, "w") as log:
+                    returncode = await self._run_logged(cmd, msbuild_cmd, log, 300)
                 
-                output = f"STDOUT:\n{result.stdout}\nSTDERR:\n{result.stderr}"
+                output = log_path.read_text(errors="replace")
                 
-                if result.returncode == 0:
+                if returncode == 0:
                     dll_path = self.bin_folder / "Debug" / "Flow.dll"
                     return BuildReport(
                         success=True,
@@ -280,32 +648,85 @@ class CsharpFlowTester:
             self.run_tests_dotnet()
         elif self.build_tool == BuildTool.MONO:
             self.run_tests_mono()
+        self._update_totals()
+
+    def _update_totals(self):
+        """Cache test method totals once results are final"""
+        self._totals = {
+            "total": sum(suite.test_count for suite in self.test_suites),
+            "passed": sum(s.test_count for s in self.test_suites if s.result == TestResult.PASS)
+        }
+
+    def _shard_suites(self, n: int) -> List[List[TestSuite]]:
+        """Distribute test suites round-robin into n shards"""
+        shards = [self.test_suites[i::n] for i in range(n)]
+        return [shard for shard in shards if shard]
 
     def run_tests_dotnet(self):
-        """Run tests using dotnet test"""
+        """Run tests using dotnet test, sharded across cores by suite"""
         print("Using .NET Test Runner...")
         
-        try:
+        # Leave two cores for the OS and the test host processes
+        workers = max(1, (os.cpu_count() or 1) - 2)
+        shards = self._shard_suites(workers) or [[]]
+        print(f"   Running {len(shards)} shard(s) in parallel")
+        
+        def trx_path(i: int) -> Path:
+            return self.bin_folder / "TestResults" / f"shard{i}" / f"shard{i}.trx"
+        
+        def run_shard(i: int, shard: List[TestSuite]) -> subprocess.CompletedProcess:
+            # Drop the previous run's results so a crashed shard can't reuse them
+            trx_path(i).unlink(missing_ok=True)
             cmd = [
                 "dotnet", "test",
                 str(self.test_project),
+                "--no-build",
                 "--configuration", "Debug",
-                "--logger", "console;verbosity=detailed",
-                "--results-directory", str(self.bin_folder / "TestResults")
+                # Test what build_with_dotnet just wrote, not TestFlow/bin
+                "--output", str(self.bin_folder / "Debug"),
+                "--logger", f"trx;LogFileName=shard{i}.trx",
+                "--blame-hang-timeout", "120s",
+                "--results-directory", str(trx_path(i).parent)
             ]
-            
+            if len(shards) > 1:
+                # A single shard runs the whole assembly unfiltered, so
+                # fixtures outside TestFlow/Editor/Test*.cs still run.
+                # The trailing dot stops TestLoop from also matching TestLoops
+                cmd += ["--filter", "|".join(
+                    f"FullyQualifiedName~{cls}." for suite in shard for cls in self._suite_classes.get(suite.name, [suite.name])
+                )]
+            return _run_process(cmd, timeout=600, cwd=self.project_root)
+        
+        try:
             start_time = time.time()
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=self.project_root,
-                timeout=600
-            )
+            with ThreadPoolExecutor(max_workers=len(shards)) as pool:
+                futures = [pool.submit(run_shard, i, shard) for i, shard in enumerate(shards)]
+                results = [future.result() for future in futures]
             duration = time.time() - start_time
             
-            # Parse test results
-            self.parse_dotnet_test_results(result.stdout, result.stderr, duration)
+            # Per-test outcomes come from the TRX logs; the console summary
+            # is only a fallback for when no shard managed to write one
+            # Results are keyed by test id, so a test that matched the
+            # filters of two shards is only counted once
+            tests: Dict[str, Tuple[str, str, float]] = {}
+            for i in range(len(shards)):
+                if trx_path(i).exists():
+                    tests.update(self._parse_trx(trx_path(i)))
+            
+            if tests:
+                self.apply_trx_results(tests)
+            else:
+                stdout = "\n".join(result.stdout for result in results)
+                stderr = "\n".join(result.stderr for result in results)
+                self.parse_dotnet_test_results(stdout, stderr, duration)
+            
+            # dotnet test exits non-zero when any one test fails, so the exit
+            # code only decides the suites of a shard that wrote no TRX log
+            for i, (shard, result) in enumerate(zip(shards, results)):
+                if result.returncode != 0 and not trx_path(i).exists():
+                    for suite in shard:
+                        suite.result = TestResult.FAIL
+                        suite.details = f"dotnet test exited with code {result.returncode}"
             
         except subprocess.TimeoutExpired:
             print("⏰ Test execution timed out")
@@ -336,17 +757,12 @@ class CsharpFlowTester:
         
         for runner in nunit_runners:
             runner_parts = runner.split()
-            if shutil.which(runner_parts[0]):
+            if _which(runner_parts[0]):
                 print(f"   Using {runner}...")
                 try:
                     cmd = runner_parts + [str(test_dll)]
                     start_time = time.time()
-                    result = subprocess.run(
-                        cmd,
-                        capture_output=True,
-                        text=True,
-                        timeout=600
-                    )
+                    result = _run_process(cmd, timeout=600)
                     duration = time.time() - start_time
                     
                     self.parse_nunit_test_results(result.stdout, result.stderr, duration)
@@ -361,23 +777,74 @@ class CsharpFlowTester:
             suite.result = TestResult.FAIL
             suite.details = "No NUnit runner available"
 
-    def parse_dotnet_test_results(self, stdout: str, stderr: str, duration: float):
-        """Parse dotnet test output"""
-        lines = stdout.split('\n')
+    def _parse_trx(self, trx_path: Path) -> Dict[str, Tuple[str, str, float]]:
+        """Stream a TRX file into {test id: (class name, outcome, seconds)}"""
+        results = []
+        classes = {}
+        for _, elem in ET.iterparse(trx_path, events=("end",)):
+            tag = elem.tag.rpartition("}")[2]
+            if tag == "UnitTestResult":
+                results.append((
+                    elem.get("testId"),
+                    elem.get("testName", ""),
+                    elem.get("outcome"),
+                    _trx_seconds(elem.get("duration"))
+                ))
+                elem.clear()
+            elif tag == "UnitTest":
+                for child in elem:
+                    if child.tag.endswith("TestMethod"):
+                        classes[elem.get("id")] = child.get("className", "")
+                elem.clear()
         
-        # Simple parsing - look for test results
-        passed_tests = 0
-        failed_tests = 0
+        tests = {}
+        for test_id, test_name, outcome, seconds in results:
+            # className may carry an assembly qualifier: "Ns.TestKernel, TestFlow"
+            class_name = classes.get(test_id) or test_name.rpartition(".")[0]
+            tests[test_id] = (class_name.split(",")[0].strip(), outcome, seconds)
+        return tests
+
+    def apply_trx_results(self, tests: Dict[str, Tuple[str, str, float]]):
+        """Update test suites from parsed TRX results, matched by declared class"""
+        owners = {}
+        for suite in self.test_suites:
+            for cls in self._suite_classes.get(suite.name, [suite.name]):
+                owners[cls] = suite.name
+                owners.setdefault(cls.rpartition(".")[2], suite.name)
         
-        for line in lines:
-            if "Passed!" in line or "passed" in line.lower():
-                passed_tests += 1
-            elif "Failed!" in line or "failed" in line.lower():
-                failed_tests += 1
+        stats: Dict[str, Tuple[int, int, float]] = {}
+        for class_name, outcome, seconds in tests.values():
+            suite_name = owners.get(class_name) or owners.get(class_name.rpartition(".")[2])
+            if suite_name is None:
+                continue
+            passed, failed, total = stats.get(suite_name, (0, 0, 0.0))
+            if outcome == "Passed":
+                passed += 1
+            elif outcome in ("Failed", "Error", "Timeout", "Aborted"):
+                failed += 1
+            stats[suite_name] = (passed, failed, total + seconds)
         
-        # Update test suite results
-        total_expected = sum(suite.test_count for suite in self.test_suites)
-        if "Test Run Successful" in stdout or failed_tests == 0:
+        for suite in self.test_suites:
+            if suite.name in stats:
+                passed, failed, seconds = stats[suite.name]
+                suite.result = TestResult.FAIL if failed else TestResult.PASS
+                suite.duration = seconds
+                suite.details = f"{passed} passed, {failed} failed"
+            elif suite.test_count == 0:
+                suite.result = TestResult.PASS
+                suite.details = "No tests"
+            else:
+                suite.result = TestResult.FAIL
+                suite.details = "No results reported"
+
+    def _summary_passed(self, stdout: str) -> bool:
+        """True if a runner summary reports success and no failures"""
+        failed = sum(int(count) for match in _FAIL_RE.finditer(stdout) for count in match.groups() if count)
+        return failed == 0 and _PASS_RE.search(stdout) is not None
+
+    def parse_dotnet_test_results(self, stdout: str, stderr: str, duration: float):
+        """Parse dotnet test output"""
+        if self._summary_passed(stdout):
             for suite in self.test_suites:
                 suite.result = TestResult.PASS
                 suite.duration = duration / len(self.test_suites)
@@ -390,8 +857,7 @@ class CsharpFlowTester:
 
     def parse_nunit_test_results(self, stdout: str, stderr: str, duration: float):
         """Parse NUnit test output"""
-        # Similar simple parsing for NUnit
-        if "Overall result: Passed" in stdout or "Test Run Successful" in stdout:
+        if self._summary_passed(stdout):
             for suite in self.test_suites:
                 suite.result = TestResult.PASS
                 suite.duration = duration / len(self.test_suites)
@@ -423,12 +889,18 @@ class CsharpFlowTester:
         
         # Test results
         print("\n🧪 TEST RESULTS:")
-        passed_suites = [s for s in self.test_suites if s.result == TestResult.PASS]
-        failed_suites = [s for s in self.test_suites if s.result == TestResult.FAIL]
-        skipped_suites = [s for s in self.test_suites if s.result == TestResult.SKIP]
+        by_result = defaultdict(list)
+        for suite in self.test_suites:
+            by_result[suite.result].append(suite)
+        passed_suites = by_result[TestResult.PASS]
+        failed_suites = by_result[TestResult.FAIL]
+        skipped_suites = by_result[TestResult.SKIP]
         
-        total_tests = sum(suite.test_count for suite in self.test_suites)
-        passed_tests = sum(suite.test_count for suite in passed_suites)
+        # Tests don't run when the build fails, so totals may not exist yet
+        if self._totals is None:
+            self._update_totals()
+        total_tests = self._totals["total"]
+        passed_tests = self._totals["passed"]
         
         print(f"📊 Test Suites: {len(passed_suites)} passed, {len(failed_suites)} failed, {len(skipped_suites)} skipped")
         print(f"📊 Test Methods: {passed_tests}/{total_tests} passed")
@@ -464,53 +936,60 @@ class CsharpFlowTester:
                 "duration": build_report.duration,
                 "binary_path": build_report.binary_path
             },
-            "test_suites": [
-                {
-                    "name": suite.name,
-                    "file_path": suite.file_path,
-                    "test_count": suite.test_count,
-                    "result": suite.result.value,
-                    "duration": suite.duration,
-                    "details": suite.details
-                }
-                for suite in self.test_suites
-            ]
+            "test_suites": self.test_suites,
+            "totals": self._totals
         }
         
         report_file = self.bin_folder / "test_report.json"
-        with open(report_file, 'w') as f:
-            json.dump(report_data, f, indent=2)
+        tmp = report_file.with_suffix(".json.tmp")
+        tmp.write_bytes(_dumps(report_data))
+        os.replace(tmp, report_file)
         
         print(f"📄 Detailed report saved: {report_file}")
 
+    async def run_async(self) -> bool:
+        """Run the complete test suite on an event loop"""
+        self.print_header()
+        
+        # Check build environment
+        build_tool = self.check_build_tools()
+        if build_tool == BuildTool.NONE:
+            return False
+        
+        # Setup
+        self.create_bin_folder()
+        
+        # Analysis and build are independent; run_tests only reads the
+        # suites after both have finished
+        suites_task = asyncio.create_task(self.analyze_project_structure())
+        try:
+            build_report = await self.build_project()
+        finally:
+            await suites_task
+        
+        # Test (if build succeeded). The blocking runner goes on a worker
+        # thread so Ctrl+C can cancel this task, which then stops the test
+        # hosts the thread is waiting on.
+        if build_report.success:
+            try:
+                await asyncio.to_thread(self.run_tests, build_report)
+            except asyncio.CancelledError:
+                _stop_all()
+                raise
+        
+        # Report
+        success = self.generate_report(build_report)
+        self.save_report_json(build_report)
+        
+        return success
+
     def run(self) -> bool:
         """Run the complete test suite"""
         try:
-            self.print_header()
-            
-            # Check build environment
-            build_tool = self.check_build_tools()
-            if build_tool == BuildTool.NONE:
-                return False
-            
-            # Setup
-            self.create_bin_folder()
-            self.analyze_project_structure()
-            
-            # Build
-            build_report = self.build_project()
-            
-            # Test (if build succeeded)
-            if build_report.success:
-                self.run_tests(build_report)
-            
-            # Report
-            success = self.generate_report(build_report)
-            self.save_report_json(build_report)
-            
-            return success
+            return asyncio.run(self.run_async())
             
         except KeyboardInterrupt:
+            _stop_all()
             print("\n⏹️  Test run interrupted by user")
             return False
         except Exception as e: